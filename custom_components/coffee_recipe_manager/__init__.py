@@ -2,11 +2,10 @@
 from __future__ import annotations
 
 import logging
-import os
-import re
 
 import voluptuous as vol
 
+from homeassistant.components import persistent_notification
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.helpers import config_validation as cv
@@ -28,12 +27,39 @@ from .const import (
     SERVICE_BREW_RECIPE,
 )
 from .executor import RecipeExecutor
-from .storage import RecipeStorage
+from .storage import RecipeStorage, friendly_from_entity_id, slugify
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS = ["sensor", "select", "button"]
 
+# Every service registered by _register_services (removed together on last unload)
+_SERVICE_NAMES = (
+    SERVICE_BREW_RECIPE,
+    SERVICE_ABORT_RECIPE,
+    "reload_recipes",
+    "add_recipe",
+    "delete_recipe",
+    "list_recipes",
+    "get_recipe",
+)
+
+# Service schemas, built once per process
+_SCHEMA_EMPTY = vol.Schema({})
+_SCHEMA_RECIPE_NAME = vol.Schema({vol.Required("recipe_name"): cv.string})
+_SCHEMA_ADD_RECIPE = vol.Schema({
+    vol.Required("name"): cv.string,
+    vol.Optional("description", default=""): cv.string,
+    vol.Required("steps"): vol.All(
+        list,
+        [{
+            vol.Required("drink"): cv.string,
+            vol.Optional("double", default=False): cv.boolean,
+            vol.Optional("timeout", default=300): vol.All(int, vol.Range(min=10, max=3600)),
+        }]
+    ),
+})
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Coffee Recipe Manager from config entry."""
@@ -57,23 +83,39 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             "machine_start_switch": config[CONF_MACHINE_START_SWITCH],
             "machine_work_state": config[CONF_MACHINE_WORK_STATE],
             "machine_double_switch": config.get(CONF_MACHINE_DOUBLE_SWITCH) or None,
-            "fault_sensors": config.get(CONF_FAULT_SENSORS, DEFAULT_FAULT_SENSORS),
+            # Ordered de-dupe: entries saved with the old default list the
+            # milkcup sensor twice, which would double its listeners
+            "fault_sensors": tuple(
+                dict.fromkeys(config.get(CONF_FAULT_SENSORS, DEFAULT_FAULT_SENSORS))
+            ),
             "notify_service": config.get(CONF_NOTIFY_SERVICE, "none"),
             "standby_state": DEFAULT_STANDBY_STATE,
         },
     )
 
-    hass.data[DOMAIN][entry.entry_id] = {
+    entry_data = hass.data[DOMAIN][entry.entry_id] = {
         "executor": executor,
         "storage": storage,
         "config": config,
+        # Configured drinks as a set for O(1) recipe validation (empty = no check)
+        "allowed_drinks": frozenset(config.get(CONF_DRINK_OPTIONS) or ()),
+        # Shared by every entity of this entry
+        "device_info": {
+            "identifiers": {(DOMAIN, entry.entry_id)},
+            "name": "Coffee Recipe Manager",
+            "manufacturer": "VahaC",
+            "model": "Recipe Manager",
+        },
     }
 
+    # Registered before initializing: on_unload callbacks also run when setup
+    # fails, so the fault listener never leaks (stopping twice is harmless)
+    entry.async_on_unload(executor.async_stop_fault_watch)
     await executor.async_initialize()
 
     # Refresh select entity whenever recipes change (UI flow saves go through storage directly)
     def _on_recipes_changed():
-        _refresh_select(hass, entry.entry_id)
+        _refresh_select(entry_data)
 
     storage.on_recipes_changed = _on_recipes_changed
 
@@ -95,12 +137,11 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         executor: RecipeExecutor = data.get("executor")
         if executor:
             await executor.abort()
+            await executor.async_shutdown()
 
     # Remove services if no more entries
     if not hass.data[DOMAIN]:
-        hass.services.async_remove(DOMAIN, SERVICE_BREW_RECIPE)
-        hass.services.async_remove(DOMAIN, SERVICE_ABORT_RECIPE)
-        for svc in ("reload_recipes", "add_recipe", "delete_recipe", "list_recipes", "get_recipe"):
+        for svc in _SERVICE_NAMES:
             hass.services.async_remove(DOMAIN, svc)
 
     return unload_ok
@@ -117,25 +158,22 @@ def _register_services(hass: HomeAssistant) -> None:
     async def handle_brew_recipe(call: ServiceCall) -> None:
         """Service: brew_recipe."""
         recipe_name = call.data["recipe_name"]
-        entry_id = _get_first_entry_id(hass)
-        if not entry_id:
+        data = _get_first_entry_data(hass)
+        if data is None:
             _LOGGER.error("No Coffee Recipe Manager entry found")
             return
 
-        data = hass.data[DOMAIN][entry_id]
         storage: RecipeStorage = data["storage"]
         executor: RecipeExecutor = data["executor"]
 
-        recipe = storage.get_recipe(recipe_name)
+        recipe = storage.find_recipe(recipe_name)
         if not recipe:
             _LOGGER.error("Recipe not found: '%s'. Available: %s", recipe_name, storage.get_recipe_names())
-            await hass.services.async_call(
-                "persistent_notification", "create",
-                {
-                    "title": "Coffee Recipe Manager",
-                    "message": f"Recipe not found: '{recipe_name}'\nAvailable: {', '.join(storage.get_recipe_names())}",
-                    "notification_id": f"{DOMAIN}_notification",
-                },
+            persistent_notification.async_create(
+                hass,
+                f"Recipe not found: '{recipe_name}'\nAvailable: {', '.join(storage.get_recipe_names())}",
+                title="Coffee Recipe Manager",
+                notification_id=f"{DOMAIN}_notification",
             )
             return
 
@@ -143,34 +181,32 @@ def _register_services(hass: HomeAssistant) -> None:
 
     async def handle_abort_recipe(call: ServiceCall) -> None:
         """Service: abort_recipe."""
-        entry_id = _get_first_entry_id(hass)
-        if not entry_id:
+        data = _get_first_entry_data(hass)
+        if data is None:
             return
-        executor: RecipeExecutor = hass.data[DOMAIN][entry_id]["executor"]
+        executor: RecipeExecutor = data["executor"]
         await executor.abort()
 
     async def handle_reload_recipes(call: ServiceCall) -> None:
         """Service: reload_recipes."""
-        entry_id = _get_first_entry_id(hass)
-        if not entry_id:
+        data = _get_first_entry_data(hass)
+        if data is None:
             return
-        data = hass.data[DOMAIN][entry_id]
         storage: RecipeStorage = data["storage"]
         await storage.load()
-        _refresh_select(hass, entry_id)
+        _refresh_select(data)
         _LOGGER.info("Recipes reloaded")
 
     async def handle_add_recipe(call: ServiceCall) -> None:
         """Service: add_recipe - add/update recipe via service call."""
-        entry_id = _get_first_entry_id(hass)
-        if not entry_id:
+        data = _get_first_entry_data(hass)
+        if data is None:
             return
-        data = hass.data[DOMAIN][entry_id]
         storage: RecipeStorage = data["storage"]
         entry_config = data["config"]
 
         recipe_name = call.data["name"]
-        key = re.sub(r"[^a-z0-9_]", "_", recipe_name.lower()).strip("_")
+        key = slugify(recipe_name)
 
         recipe = {
             "name": recipe_name,
@@ -181,83 +217,61 @@ def _register_services(hass: HomeAssistant) -> None:
         # Validate drinks against configured list
         allowed = entry_config.get(CONF_DRINK_OPTIONS)
         if allowed:
-            invalid = RecipeStorage.validate_drinks(recipe, allowed)
+            invalid = RecipeStorage.validate_drinks(recipe, data["allowed_drinks"])
             if invalid:
                 _LOGGER.error(
                     "Recipe '%s' contains drinks not configured for this machine: %s",
                     recipe_name, invalid,
                 )
-                await hass.services.async_call(
-                    "persistent_notification", "create",
-                    {
-                        "title": "Coffee Recipe Manager",
-                        "message": (
-                            f"Cannot save recipe **{recipe_name}**:\n"
-                            f"Unknown drinks: {', '.join(invalid)}\n"
-                            f"Allowed: {', '.join(allowed)}"
-                        ),
-                        "notification_id": f"{DOMAIN}_validation_error",
-                    },
+                persistent_notification.async_create(
+                    hass,
+                    (
+                        f"Cannot save recipe **{recipe_name}**:\n"
+                        f"Unknown drinks: {', '.join(invalid)}\n"
+                        f"Allowed: {', '.join(allowed)}"
+                    ),
+                    title="Coffee Recipe Manager",
+                    notification_id=f"{DOMAIN}_validation_error",
                 )
                 return
 
         success = await storage.save_recipe(key, recipe)
         if success:
-            _refresh_select(hass, entry_id)
+            _refresh_select(data)
             _LOGGER.info("Recipe '%s' saved as '%s'", recipe_name, key)
         else:
             _LOGGER.error("Failed to save recipe '%s'", recipe_name)
 
     async def handle_delete_recipe(call: ServiceCall) -> None:
         """Service: delete_recipe."""
-        entry_id = _get_first_entry_id(hass)
-        if not entry_id:
+        data = _get_first_entry_data(hass)
+        if data is None:
             return
-        storage: RecipeStorage = hass.data[DOMAIN][entry_id]["storage"]
+        storage: RecipeStorage = data["storage"]
         await storage.delete_recipe(call.data["recipe_name"])
-        _refresh_select(hass, entry_id)
+        _refresh_select(data)
 
     async def handle_list_recipes(call: ServiceCall) -> None:
         """Service: list_recipes — show all recipes in a persistent notification."""
-        entry_id = _get_first_entry_id(hass)
-        if not entry_id:
+        data = _get_first_entry_data(hass)
+        if data is None:
             return
-        storage: RecipeStorage = hass.data[DOMAIN][entry_id]["storage"]
-        recipes = storage.recipes
-        if not recipes:
+        storage: RecipeStorage = data["storage"]
+        summaries = storage.summaries
+        if not summaries:
             msg = "No recipes found."
         else:
-            lines = []
-            for key, data in recipes.items():
-                def _step_summary(s: dict) -> str:
-                    parts = []
-                    drink = s.get("drink")
-                    if drink and drink.lower() != "none":
-                        parts.append(f"{drink}{'×2' if s.get('double') else ''}")
-                    for eid, cnt in (s.get("switch_counts") or {}).items():
-                        cnt = int(cnt) if cnt else 0
-                        if cnt > 0:
-                            name = eid.split(".")[-1].replace("_", " ").title()
-                            parts.append(f"{name} ×{cnt}")
-                    return ", ".join(parts) if parts else "(empty step)"
-                steps_summary = ", ".join(_step_summary(s) for s in data.get("steps", []))
-                lines.append(f"**{data['name']}** (`{key}`)  \n{steps_summary}")
-            msg = "\n\n".join(lines)
-        await hass.services.async_call(
-            "persistent_notification", "create",
-            {
-                "title": "Coffee Recipes",
-                "message": msg,
-                "notification_id": f"{DOMAIN}_list",
-            },
+            msg = "\n\n".join(summaries.values())
+        persistent_notification.async_create(
+            hass, msg, title="Coffee Recipes", notification_id=f"{DOMAIN}_list"
         )
 
     async def handle_get_recipe(call: ServiceCall) -> None:
         """Service: get_recipe — show a single recipe's full details."""
-        entry_id = _get_first_entry_id(hass)
-        if not entry_id:
+        data = _get_first_entry_data(hass)
+        if data is None:
             return
-        storage: RecipeStorage = hass.data[DOMAIN][entry_id]["storage"]
+        storage: RecipeStorage = data["storage"]
         key = call.data["recipe_name"]
         recipe = storage.get_recipe(key)
         if not recipe:
@@ -267,7 +281,7 @@ def _register_services(hass: HomeAssistant) -> None:
                 state = hass.states.get(entity_id)
                 if state and state.name:
                     return state.name
-                return entity_id.split(".")[-1].replace("_", " ").title()
+                return friendly_from_entity_id(entity_id)
 
             def _fmt_step(i: int, step: dict) -> str:
                 parts: list[str] = []
@@ -298,84 +312,30 @@ def _register_services(hass: HomeAssistant) -> None:
             if description:
                 msg += f"*{description}*\n\n"
             msg += "\n".join(lines)
-        await hass.services.async_call(
-            "persistent_notification", "create",
-            {
-                "title": "Coffee Recipe Detail",
-                "message": msg,
-                "notification_id": f"{DOMAIN}_detail_{key}",
-            },
+        persistent_notification.async_create(
+            hass, msg, title="Coffee Recipe Detail", notification_id=f"{DOMAIN}_detail_{key}"
         )
 
 
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_BREW_RECIPE,
-        handle_brew_recipe,
-        schema=vol.Schema({vol.Required("recipe_name"): cv.string}),
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_ABORT_RECIPE,
-        handle_abort_recipe,
-        schema=vol.Schema({}),
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        "reload_recipes",
-        handle_reload_recipes,
-        schema=vol.Schema({}),
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        "add_recipe",
-        handle_add_recipe,
-        schema=vol.Schema({
-            vol.Required("name"): cv.string,
-            vol.Optional("description", default=""): cv.string,
-            vol.Required("steps"): vol.All(
-                list,
-                [{
-                    vol.Required("drink"): cv.string,
-                    vol.Optional("double", default=False): cv.boolean,
-                    vol.Optional("timeout", default=300): vol.All(int, vol.Range(min=10, max=3600)),
-                }]
-            ),
-        }),
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        "delete_recipe",
-        handle_delete_recipe,
-        schema=vol.Schema({vol.Required("recipe_name"): cv.string}),
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        "list_recipes",
-        handle_list_recipes,
-        schema=vol.Schema({}),
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        "get_recipe",
-        handle_get_recipe,
-        schema=vol.Schema({vol.Required("recipe_name"): cv.string}),
-    )
+    for name, handler, schema in (
+        (SERVICE_BREW_RECIPE, handle_brew_recipe, _SCHEMA_RECIPE_NAME),
+        (SERVICE_ABORT_RECIPE, handle_abort_recipe, _SCHEMA_EMPTY),
+        ("reload_recipes", handle_reload_recipes, _SCHEMA_EMPTY),
+        ("add_recipe", handle_add_recipe, _SCHEMA_ADD_RECIPE),
+        ("delete_recipe", handle_delete_recipe, _SCHEMA_RECIPE_NAME),
+        ("list_recipes", handle_list_recipes, _SCHEMA_EMPTY),
+        ("get_recipe", handle_get_recipe, _SCHEMA_RECIPE_NAME),
+    ):
+        hass.services.async_register(DOMAIN, name, handler, schema=schema)
 
 
-def _get_first_entry_id(hass: HomeAssistant) -> str | None:
-    entries = list(hass.data.get(DOMAIN, {}).keys())
-    return entries[0] if entries else None
+def _get_first_entry_data(hass: HomeAssistant) -> dict | None:
+    """Return the hass.data dict of the first config entry, resolved once per call."""
+    return next(iter(hass.data.get(DOMAIN, {}).values()), None)
 
 
-def _refresh_select(hass: HomeAssistant, entry_id: str) -> None:
+def _refresh_select(data: dict) -> None:
     """Tell the recipe select entity to refresh its options."""
-    select_entity = hass.data.get(DOMAIN, {}).get(entry_id, {}).get("recipe_select")
+    select_entity = data.get("recipe_select")
     if select_entity is not None:
         select_entity.reload_options()
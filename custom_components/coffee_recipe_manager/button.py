@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import logging
 
+from homeassistant.components import persistent_notification
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
@@ -10,50 +11,78 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
 from .executor import RecipeExecutor
-from .storage import RecipeStorage
+from .storage import RecipeStorage, friendly_from_entity_id
 
 _LOGGER = logging.getLogger(__name__)
 
 
-def _format_step(i: int, step: dict, hass=None) -> str:
-    """Return a human-readable line for one recipe step."""
-    parts: list[str] = []
+def _switch_name(hass, entity_id: str) -> str:
+    """Return the friendly name of a switch, or a title-cased object id."""
+    if hass:
+        state = hass.states.get(entity_id)
+        if state and state.name:
+            return state.name
+    return friendly_from_entity_id(entity_id)
+
+
+def _cached_switch_name(hass, names: dict[str, str], entity_id: str) -> str:
+    """Return _switch_name(), memoized in *names* for the current render."""
+    name = names.get(entity_id)
+    if name is None:
+        name = names[entity_id] = _switch_name(hass, entity_id)
+    return name
+
+
+def _format_step(
+    out: list[str], i: int, step: dict, hass=None, names: dict[str, str] | None = None
+) -> None:
+    """Append a human-readable line for one recipe step to *out*.
+
+    *names* caches switch display names across the steps of one render.
+    """
+    if names is None:
+        names = {}
+    out.append(f"{i}. ")
+    start = len(out)
 
     # Drink
     drink = step.get("drink")
     if drink and drink.lower() != "none":
-        double = " (double)" if step.get("double") else ""
-        parts.append(f"☕ {drink}{double}")
-
-    def _switch_name(entity_id: str) -> str:
-        if hass:
-            state = hass.states.get(entity_id)
-            if state and state.name:
-                return state.name
-        return entity_id.split(".")[-1].replace("_", " ").title()
+        out.append("☕ ")
+        out.append(drink)
+        if step.get("double"):
+            out.append(" (double)")
 
     # switch_counts (v0.3.3+ format)
-    switch_counts: dict = step.get("switch_counts") or {}
+    switch_counts: dict | None = step.get("switch_counts")
     if switch_counts:
         for entity_id, count in switch_counts.items():
             count = int(count) if count else 0
             if count <= 0:
                 continue
-            times = f"×{count}"
-            parts.append(f"⇄ {_switch_name(entity_id)} {times}")
+            if len(out) > start:
+                out.append(", ")
+            out.append("⇄ ")
+            out.append(_cached_switch_name(hass, names, entity_id))
+            out.append(f" ×{count}")
     # Legacy: switches list
     elif step.get("switches"):
         raw = step["switches"]
-        entities = [raw] if isinstance(raw, str) else list(raw)
-        for entity_id in entities:
-            parts.append(f"⇄ {_switch_name(entity_id)}")
+        for entity_id in ((raw,) if isinstance(raw, str) else raw):
+            if len(out) > start:
+                out.append(", ")
+            out.append("⇄ ")
+            out.append(_cached_switch_name(hass, names, entity_id))
     # Legacy: single switch
     elif step.get("switch"):
-        parts.append(f"⇄ {_switch_name(step['switch'])}")
+        if len(out) > start:
+            out.append(", ")
+        out.append("⇄ ")
+        out.append(_cached_switch_name(hass, names, step["switch"]))
 
-    timeout = step.get("timeout", 300)
-    content = ", ".join(parts) if parts else "(empty step)"
-    return f"{i}. {content} — {timeout}s"
+    if len(out) == start:
+        out.append("(empty step)")
+    out.append(f" — {step.get('timeout', 300)}s")
 
 
 async def async_setup_entry(
@@ -62,13 +91,14 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up button entities."""
-    executor: RecipeExecutor = hass.data[DOMAIN][entry.entry_id]["executor"]
-    storage: RecipeStorage = hass.data[DOMAIN][entry.entry_id]["storage"]
+    data = hass.data[DOMAIN][entry.entry_id]
+    executor: RecipeExecutor = data["executor"]
+    device_info: dict = data["device_info"]
     async_add_entities([
-        CoffeeBrewButton(entry, hass, executor, storage),
-        CoffeeAbortButton(entry, executor),
-        CoffeeViewRecipeButton(entry, hass, storage),
-        CoffeeEditRecipeButton(entry, hass),
+        CoffeeBrewButton(entry, hass, data),
+        CoffeeAbortButton(entry, executor, device_info),
+        CoffeeViewRecipeButton(entry, hass, data),
+        CoffeeEditRecipeButton(entry, hass, device_info),
     ])
 
 
@@ -85,18 +115,20 @@ class CoffeeBrewButton(ButtonEntity):
         self,
         entry: ConfigEntry,
         hass: HomeAssistant,
-        executor: RecipeExecutor,
-        storage: RecipeStorage,
+        entry_data: dict,
     ) -> None:
         self._entry = entry
         self._hass = hass
-        self._executor = executor
-        self._storage = storage
+        # recipe_select is added to this dict later by the select platform
+        self._entry_data = entry_data
+        self._executor: RecipeExecutor = entry_data["executor"]
+        self._storage: RecipeStorage = entry_data["storage"]
+        self._device_info = entry_data["device_info"]
         self._attr_unique_id = f"{entry.entry_id}_brew_button"
 
     async def async_press(self) -> None:
         """Start the selected recipe."""
-        select_entity = self._hass.data[DOMAIN][self._entry.entry_id].get("recipe_select")
+        select_entity = self._entry_data.get("recipe_select")
         if select_entity is None:
             _LOGGER.error("Recipe select entity not found")
             return
@@ -116,12 +148,7 @@ class CoffeeBrewButton(ButtonEntity):
 
     @property
     def device_info(self) -> dict:
-        return {
-            "identifiers": {(DOMAIN, self._entry.entry_id)},
-            "name": "Coffee Recipe Manager",
-            "manufacturer": "VahaC",
-            "model": "Recipe Manager",
-        }
+        return self._device_info
 
 
 class CoffeeViewRecipeButton(ButtonEntity):
@@ -131,65 +158,59 @@ class CoffeeViewRecipeButton(ButtonEntity):
     _attr_name = "View Selected Recipe"
     _attr_icon = "mdi:text-box-search-outline"
 
+    _NOTIFICATION_ID = f"{DOMAIN}_view"
+
     def __init__(
         self,
         entry: ConfigEntry,
         hass: HomeAssistant,
-        storage: RecipeStorage,
+        entry_data: dict,
     ) -> None:
         self._entry = entry
         self._hass = hass
-        self._storage = storage
+        self._entry_data = entry_data
+        self._storage: RecipeStorage = entry_data["storage"]
+        self._device_info = entry_data["device_info"]
         self._attr_unique_id = f"{entry.entry_id}_view_recipe_button"
 
     async def async_press(self) -> None:
         """Show selected recipe details as a persistent notification."""
-        select_entity = self._hass.data[DOMAIN][self._entry.entry_id].get("recipe_select")
+        select_entity = self._entry_data.get("recipe_select")
         key = select_entity.get_selected_key() if select_entity else None
 
         if not key:
-            await self._hass.services.async_call(
-                "persistent_notification", "create",
-                {"title": "Coffee Recipe Manager", "message": "No recipe selected.",
-                 "notification_id": f"{DOMAIN}_view"},
-            )
+            self._notify("Coffee Recipe Manager", "No recipe selected.")
             return
 
         recipe = self._storage.get_recipe(key)
         if not recipe:
-            await self._hass.services.async_call(
-                "persistent_notification", "create",
-                {"title": "Coffee Recipe Manager", "message": f"Recipe `{key}` not found.",
-                 "notification_id": f"{DOMAIN}_view"},
-            )
+            self._notify("Coffee Recipe Manager", f"Recipe `{key}` not found.")
             return
 
-        steps = recipe.get("steps", [])
-        lines = [_format_step(i, step, self._hass) for i, step in enumerate(steps, 1)]
-
+        parts = ["### ", recipe["name"], "\n"]
         description = recipe.get("description", "")
-        msg = f"### {recipe['name']}\n"
         if description:
-            msg += f"*{description}*\n\n"
-        msg += "\n".join(lines)
-
-        await self._hass.services.async_call(
-            "persistent_notification", "create",
-            {
-                "title": f"Recipe: {recipe['name']}",
-                "message": msg,
-                "notification_id": f"{DOMAIN}_view",
-            },
+            parts.extend(("*", description, "*\n\n"))
+        names: dict[str, str] = {}
+        steps = recipe.get("steps", [])
+        for i, step in enumerate(steps, 1):
+            _format_step(parts, i, step, self._hass, names)
+            parts.append("\n")
+        if steps:
+            parts.pop()  # no newline after the last step
+        msg = "".join(parts)
+
+        self._notify(f"Recipe: {recipe['name']}", msg)
+
+    def _notify(self, title: str, message: str) -> None:
+        """Show (or replace) this button's persistent notification."""
+        persistent_notification.async_create(
+            self._hass, message, title=title, notification_id=self._NOTIFICATION_ID
         )
 
     @property
     def device_info(self) -> dict:
-        return {
-            "identifiers": {(DOMAIN, self._entry.entry_id)},
-            "name": "Coffee Recipe Manager",
-            "manufacturer": "VahaC",
-            "model": "Recipe Manager",
-        }
+        return self._device_info
 
 
 # ---------------------------------------------------------------------------
@@ -201,34 +222,28 @@ class CoffeeEditRecipeButton(ButtonEntity):
     _attr_name = "Edit Recipes"
     _attr_icon = "mdi:pencil-box"
 
-    def __init__(self, entry: ConfigEntry, hass: HomeAssistant) -> None:
+    def __init__(self, entry: ConfigEntry, hass: HomeAssistant, device_info: dict) -> None:
         self._entry = entry
         self._hass = hass
+        self._device_info = device_info
         self._attr_unique_id = f"{entry.entry_id}_edit_recipe_button"
 
     async def async_press(self) -> None:
         """Create a notification with a deep-link to the integration's config page."""
         path = f"/config/integrations/integration/{DOMAIN}"
-        await self._hass.services.async_call(
-            "persistent_notification", "create",
-            {
-                "title": "Coffee Recipe Manager",
-                "message": (
-                    "Tap the link below to open the recipe editor:\n\n"
-                    f"[✏️ Open Recipe Editor]({path})"
-                ),
-                "notification_id": f"{DOMAIN}_edit_shortcut",
-            },
+        persistent_notification.async_create(
+            self._hass,
+            (
+                "Tap the link below to open the recipe editor:\n\n"
+                f"[✏️ Open Recipe Editor]({path})"
+            ),
+            title="Coffee Recipe Manager",
+            notification_id=f"{DOMAIN}_edit_shortcut",
         )
 
     @property
     def device_info(self) -> dict:
-        return {
-            "identifiers": {(DOMAIN, self._entry.entry_id)},
-            "name": "Coffee Recipe Manager",
-            "manufacturer": "VahaC",
-            "model": "Recipe Manager",
-        }
+        return self._device_info
 
 
 # ---------------------------------------------------------------------------
@@ -240,9 +255,10 @@ class CoffeeAbortButton(ButtonEntity):
     _attr_name = "Abort Recipe"
     _attr_icon = "mdi:stop-circle"
 
-    def __init__(self, entry: ConfigEntry, executor: RecipeExecutor) -> None:
+    def __init__(self, entry: ConfigEntry, executor: RecipeExecutor, device_info: dict) -> None:
         self._entry = entry
         self._executor = executor
+        self._device_info = device_info
         self._attr_unique_id = f"{entry.entry_id}_abort_button"
 
     async def async_press(self) -> None:
@@ -252,9 +268,4 @@ class CoffeeAbortButton(ButtonEntity):
 
     @property
     def device_info(self) -> dict:
-        return {
-            "identifiers": {(DOMAIN, self._entry.entry_id)},
-            "name": "Coffee Recipe Manager",
-            "manufacturer": "VahaC",
-            "model": "Recipe Manager",
-        }
+        return self._device_info
@@ -1,9 +1,10 @@
 """Config flow for Coffee Recipe Manager."""
 from __future__ import annotations
 
+from collections import ChainMap
+from datetime import datetime
 import logging
-import re
-from typing import Any
+from typing import Any, Sequence
 
 import voluptuous as vol
 
@@ -31,9 +32,97 @@ from .const import (
     DRINK_OPTIONS,
     DOMAIN,
 )
+from .storage import RecipeStorage, friendly_from_entity_id, slugify
 
 _LOGGER = logging.getLogger(__name__)
 
+# Machine entities that must exist before the config flow continues
+_REQUIRED_ENTITY_KEYS = (
+    CONF_MACHINE_DRINK_SELECT,
+    CONF_MACHINE_START_SWITCH,
+    CONF_MACHINE_WORK_STATE,
+)
+
+# Selectors shared by the config and options flow schemas
+_DRINK_SELECT_SELECTOR = selector.EntitySelector(
+    selector.EntitySelectorConfig(domain="select")
+)
+_SWITCH_SELECTOR = selector.EntitySelector(
+    selector.EntitySelectorConfig(domain="switch")
+)
+_WORK_STATE_SELECTOR = selector.EntitySelector(
+    selector.EntitySelectorConfig(domain=["sensor", "input_select"])
+)
+_SWITCHES_SELECTOR = selector.EntitySelector(
+    selector.EntitySelectorConfig(domain="switch", multiple=True)
+)
+_FAULT_SENSORS_SELECTOR = selector.EntitySelector(
+    selector.EntitySelectorConfig(domain="binary_sensor", multiple=True)
+)
+_TEXT_SELECTOR = selector.TextSelector()
+_BOOLEAN_SELECTOR = selector.BooleanSelector()
+_TIMEOUT_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=10, max=3600, step=10,
+        unit_of_measurement="s",
+        mode=selector.NumberSelectorMode.BOX,
+    )
+)
+_SWITCH_COUNT_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=0, max=10, step=1,
+        mode=selector.NumberSelectorMode.BOX,
+    )
+)
+
+# Config flow schemas with constant defaults, built once at import.
+# Multiple entity selectors only accept lists, so tuple defaults are copied.
+_USER_SCHEMA = vol.Schema({
+    vol.Required(
+        CONF_MACHINE_DRINK_SELECT,
+        default=DEFAULT_DRINK_SELECT,
+    ): _DRINK_SELECT_SELECTOR,
+    vol.Required(
+        CONF_MACHINE_START_SWITCH,
+        default=DEFAULT_START_SWITCH,
+    ): _SWITCH_SELECTOR,
+    vol.Required(
+        CONF_MACHINE_WORK_STATE,
+        default=DEFAULT_WORK_STATE,
+    ): _WORK_STATE_SELECTOR,
+    vol.Optional(
+        CONF_MACHINE_DOUBLE_SWITCH,
+    ): _SWITCH_SELECTOR,
+    vol.Optional(
+        CONF_AUXILIARY_SWITCHES,
+        default=list(DEFAULT_AUXILIARY_SWITCHES),
+    ): _SWITCHES_SELECTOR,
+})
+
+_FAULTS_SCHEMA = vol.Schema({
+    vol.Optional(
+        CONF_FAULT_SENSORS,
+        default=list(DEFAULT_FAULT_SENSORS),
+    ): _FAULT_SENSORS_SELECTOR,
+})
+
+_NOTIFY_SCHEMA = vol.Schema({
+    vol.Optional(
+        CONF_NOTIFY_SERVICE,
+        default="none",
+    ): str,
+    vol.Optional(
+        CONF_RECIPES_FILE,
+        default=DEFAULT_RECIPES_FILE,
+    ): str,
+})
+
+# Options flow: new recipe name + description
+_RECIPE_ADD_SCHEMA = vol.Schema({
+    vol.Required("name"): _TEXT_SELECTOR,
+    vol.Optional("description", default=""): _TEXT_SELECTOR,
+})
+
 
 class CoffeeRecipeManagerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle config flow for Coffee Recipe Manager."""
@@ -50,55 +139,22 @@ class CoffeeRecipeManagerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            # Validate that entities exist
-            for key in [
-                CONF_MACHINE_DRINK_SELECT,
-                CONF_MACHINE_START_SWITCH,
-                CONF_MACHINE_WORK_STATE,
-            ]:
-                entity_id = user_input.get(key, "")
-                if not self.hass.states.get(entity_id):
-                    errors[key] = "entity_not_found"
+            # Validate that entities exist (empty ids fail without a lookup)
+            states_get = self.hass.states.get
+            errors = {
+                key: "entity_not_found"
+                for key in _REQUIRED_ENTITY_KEYS
+                if not (entity_id := user_input.get(key)) or not states_get(entity_id)
+            }
 
             if not errors:
-                self._data = user_input
+                # Own copy: later steps update() it with their fields
+                self._data = dict(user_input)
                 return await self.async_step_drinks()
 
-        schema = vol.Schema({
-            vol.Required(
-                CONF_MACHINE_DRINK_SELECT,
-                default=DEFAULT_DRINK_SELECT,
-            ): selector.EntitySelector(
-                selector.EntitySelectorConfig(domain="select")
-            ),
-            vol.Required(
-                CONF_MACHINE_START_SWITCH,
-                default=DEFAULT_START_SWITCH,
-            ): selector.EntitySelector(
-                selector.EntitySelectorConfig(domain="switch")
-            ),
-            vol.Required(
-                CONF_MACHINE_WORK_STATE,
-                default=DEFAULT_WORK_STATE,
-            ): selector.EntitySelector(
-                selector.EntitySelectorConfig(domain=["sensor", "input_select"])
-            ),
-            vol.Optional(
-                CONF_MACHINE_DOUBLE_SWITCH,
-            ): selector.EntitySelector(
-                selector.EntitySelectorConfig(domain="switch")
-            ),
-            vol.Optional(
-                CONF_AUXILIARY_SWITCHES,
-                default=DEFAULT_AUXILIARY_SWITCHES,
-            ): selector.EntitySelector(
-                selector.EntitySelectorConfig(domain="switch", multiple=True)
-            ),
-        })
-
         return self.async_show_form(
             step_id="user",
-            data_schema=schema,
+            data_schema=_USER_SCHEMA,
             errors=errors,
             description_placeholders={
                 "docs_url": "https://github.com/vahac/coffee-recipe-manager"
@@ -114,14 +170,13 @@ class CoffeeRecipeManagerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             return await self.async_step_faults()
 
         available = _get_machine_drink_options(self.hass, self._data.get(CONF_MACHINE_DRINK_SELECT))
-        options = [selector.SelectOptionDict(value=d, label=d) for d in available]
         schema = vol.Schema({
             vol.Required(
                 CONF_DRINK_OPTIONS,
-                default=available,
+                default=list(available),
             ): selector.SelectSelector(
                 selector.SelectSelectorConfig(
-                    options=options,
+                    options=list(available),
                     multiple=True,
                     mode=selector.SelectSelectorMode.LIST,
                 )
@@ -138,21 +193,9 @@ class CoffeeRecipeManagerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             self._data.update(user_input)
             return await self.async_step_notify()
 
-        schema = vol.Schema({
-            vol.Optional(
-                CONF_FAULT_SENSORS,
-                default=DEFAULT_FAULT_SENSORS,
-            ): selector.EntitySelector(
-                selector.EntitySelectorConfig(
-                    domain="binary_sensor",
-                    multiple=True,
-                )
-            ),
-        })
-
         return self.async_show_form(
             step_id="faults",
-            data_schema=schema,
+            data_schema=_FAULTS_SCHEMA,
         )
 
     async def async_step_notify(
@@ -166,20 +209,9 @@ class CoffeeRecipeManagerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 data=self._data,
             )
 
-        schema = vol.Schema({
-            vol.Optional(
-                CONF_NOTIFY_SERVICE,
-                default="none",
-            ): str,
-            vol.Optional(
-                CONF_RECIPES_FILE,
-                default=DEFAULT_RECIPES_FILE,
-            ): str,
-        })
-
         return self.async_show_form(
             step_id="notify",
-            data_schema=schema,
+            data_schema=_NOTIFY_SCHEMA,
         )
 
     @staticmethod
@@ -191,20 +223,29 @@ class CoffeeRecipeManagerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         return CoffeeRecipeManagerOptionsFlow(config_entry)
 
 
-_DEFAULT_STEPS_EXAMPLE = [
-    {"drink": "Espresso", "double": False, "timeout": 300},
-]
+# entity_id -> (state.last_updated the options were read at, options).
+# Only the timestamp is kept, so no State object outlives its entity or entry.
+_DRINK_OPTIONS_CACHE: dict[str, tuple[datetime, tuple[str, ...]]] = {}
+
 
+def _get_machine_drink_options(hass, entity_id: str | None) -> tuple[str, ...]:
+    """Return drink options from the machine's select entity, falling back to DRINK_OPTIONS.
 
-def _get_machine_drink_options(hass, entity_id: str | None) -> list[str]:
-    """Return drink options from the machine's select entity, falling back to DRINK_OPTIONS."""
+    last_updated changes on every state or attribute change, so the options
+    are re-read only when the entity has been updated since the last read.
+    """
     if entity_id:
         state = hass.states.get(entity_id)
         if state:
-            opts = state.attributes.get("options", [])
+            cached = _DRINK_OPTIONS_CACHE.get(entity_id)
+            if cached is not None and cached[0] == state.last_updated:
+                opts = cached[1]
+            else:
+                opts = tuple(state.attributes.get("options", ()))
+                _DRINK_OPTIONS_CACHE[entity_id] = (state.last_updated, opts)
             if opts:
-                return list(opts)
-    return list(DRINK_OPTIONS)
+                return opts
+    return DRINK_OPTIONS
 
 
 class CoffeeRecipeManagerOptionsFlow(config_entries.OptionsFlow):
@@ -217,30 +258,94 @@ class CoffeeRecipeManagerOptionsFlow(config_entries.OptionsFlow):
         self._recipe_name: str = ""
         self._recipe_description: str = ""
         self._recipe_steps: list[dict] = []
-        self._step_prefill: list[dict] = []  # existing steps when editing
+        self._step_prefill: Sequence[dict] = ()  # existing steps when editing (read-only)
         self._step_index: int = 0
+        # switch_count_N form keys, one per aux switch — built once per flow
+        self._switch_count_keys: tuple[str, ...] = ()
+        # (aux switches, sw_name_N placeholders) — resolved once per flow
+        self._sw_name_cache: tuple[tuple[str, ...], dict[str, str]] | None = None
+        self._current: ChainMap | None = None
+        # Step drink dropdown — resolved once per flow
+        self._drink_selector_cache: selector.SelectSelector | None = None
+        # (storage version, recipe picker options)
+        self._recipe_options_cache: tuple[int, list[selector.SelectOptionDict]] | None = None
 
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
 
+    def _count_keys(self, aux_switches: Sequence[str]) -> tuple[str, ...]:
+        """Return the switch_count_N field keys for *aux_switches*."""
+        if len(self._switch_count_keys) != len(aux_switches):
+            self._switch_count_keys = tuple(
+                f"switch_count_{i}" for i in range(len(aux_switches))
+            )
+        return self._switch_count_keys
+
+    def _switch_name_placeholders(self, aux_switches: Sequence[str]) -> dict[str, str]:
+        """Return sw_name_N friendly-name placeholders for *aux_switches*."""
+        key = tuple(aux_switches)
+        if self._sw_name_cache is not None and self._sw_name_cache[0] == key:
+            return self._sw_name_cache[1]
+        placeholders: dict[str, str] = {}
+        for i, entity_id in enumerate(key):
+            state = self.hass.states.get(entity_id)
+            if state and state.name:
+                friendly = state.name
+            else:
+                friendly = friendly_from_entity_id(entity_id)
+            placeholders[f"sw_name_{i}"] = friendly
+        self._sw_name_cache = (key, placeholders)
+        return placeholders
+
+    def _drink_selector(self) -> selector.SelectSelector:
+        """Return the step drink dropdown ("none" + configured drinks)."""
+        if self._drink_selector_cache is not None:
+            return self._drink_selector_cache
+        current = self._current_config()
+        configured_drinks = current.get(CONF_DRINK_OPTIONS)
+        if configured_drinks is None:
+            configured_drinks = _get_machine_drink_options(
+                self.hass, current.get(CONF_MACHINE_DRINK_SELECT)
+            )
+        # SelectSelector needs all-string or all-dict options; "none" has a label
+        drink_options = [
+            selector.SelectOptionDict(value="none", label="— None —"),
+        ] + [selector.SelectOptionDict(value=d, label=d) for d in configured_drinks]
+        self._drink_selector_cache = selector.SelectSelector(
+            selector.SelectSelectorConfig(
+                options=drink_options,
+                mode=selector.SelectSelectorMode.DROPDOWN,
+            )
+        )
+        return self._drink_selector_cache
+
+    def _current_config(self) -> ChainMap:
+        """Return entry options layered over entry data (read-only view, no copy)."""
+        if self._current is None:
+            self._current = ChainMap(self._config_entry.options, self._config_entry.data)
+        return self._current
+
     def _get_storage(self):
         return self.hass.data[DOMAIN][self._config_entry.entry_id]["storage"]
 
     def _recipe_options(self) -> list[selector.SelectOptionDict]:
         storage = self._get_storage()
-        return [
-            selector.SelectOptionDict(value=key, label=f"{data['name']} ({key})")
+        cached = self._recipe_options_cache
+        if cached is not None and cached[0] == storage.version:
+            return cached[1]
+        option = selector.SelectOptionDict
+        options = [
+            option(value=key, label=f"{data['name']} ({key})")
             for key, data in storage.recipes.items()
         ]
+        self._recipe_options_cache = (storage.version, options)
+        return options
 
     async def _save_current_recipe(self) -> config_entries.FlowResult:
         """Validate drinks then save the accumulated recipe."""
-        from .storage import RecipeStorage
         storage = self._get_storage()
-        key = self._edit_key or re.sub(
-            r"[^a-z0-9_]", "_", self._recipe_name.lower()
-        ).strip("_")
+        key = self._edit_key or slugify(self._recipe_name)
         recipe = {
             "name": self._recipe_name,
             "description": self._recipe_description,
@@ -248,10 +353,10 @@ class CoffeeRecipeManagerOptionsFlow(config_entries.OptionsFlow):
         }
 
         # Validate drinks against configured list
-        current_config = {**self._config_entry.data, **self._config_entry.options}
+        current_config = self._current_config()
         allowed = current_config.get(CONF_DRINK_OPTIONS)
         if allowed:
-            invalid = RecipeStorage.validate_drinks(recipe, allowed)
+            invalid = RecipeStorage.validate_drinks(recipe, frozenset(allowed))
             if invalid:
                 return self.async_abort(reason="invalid_drink_in_recipe")
 
@@ -284,49 +389,39 @@ class CoffeeRecipeManagerOptionsFlow(config_entries.OptionsFlow):
         if user_input is not None:
             return self.async_create_entry(title="", data=user_input)
 
-        current = {**self._config_entry.data, **self._config_entry.options}
+        current = self._current_config()
 
         schema = vol.Schema({
             vol.Required(
                 CONF_MACHINE_DRINK_SELECT,
                 default=current.get(CONF_MACHINE_DRINK_SELECT, DEFAULT_DRINK_SELECT),
-            ): selector.EntitySelector(
-                selector.EntitySelectorConfig(domain="select")
-            ),
+            ): _DRINK_SELECT_SELECTOR,
             vol.Required(
                 CONF_MACHINE_START_SWITCH,
                 default=current.get(CONF_MACHINE_START_SWITCH, DEFAULT_START_SWITCH),
-            ): selector.EntitySelector(
-                selector.EntitySelectorConfig(domain="switch")
-            ),
+            ): _SWITCH_SELECTOR,
             vol.Required(
                 CONF_MACHINE_WORK_STATE,
                 default=current.get(CONF_MACHINE_WORK_STATE, DEFAULT_WORK_STATE),
-            ): selector.EntitySelector(
-                selector.EntitySelectorConfig(domain=["sensor", "input_select"])
-            ),
+            ): _WORK_STATE_SELECTOR,
             vol.Optional(
                 CONF_MACHINE_DOUBLE_SWITCH,
                 default=current.get(CONF_MACHINE_DOUBLE_SWITCH, ""),
-            ): selector.EntitySelector(
-                selector.EntitySelectorConfig(domain="switch")
-            ),
+            ): _SWITCH_SELECTOR,
             vol.Optional(
                 CONF_FAULT_SENSORS,
-                default=current.get(CONF_FAULT_SENSORS, DEFAULT_FAULT_SENSORS),
-            ): selector.EntitySelector(
-                selector.EntitySelectorConfig(domain="binary_sensor", multiple=True)
-            ),
+                default=list(current.get(CONF_FAULT_SENSORS, DEFAULT_FAULT_SENSORS)),
+            ): _FAULT_SENSORS_SELECTOR,
             vol.Optional(
                 CONF_NOTIFY_SERVICE,
                 default=current.get(CONF_NOTIFY_SERVICE, "none"),
             ): str,
             vol.Optional(
                 CONF_AUXILIARY_SWITCHES,
-                default=current.get(CONF_AUXILIARY_SWITCHES, DEFAULT_AUXILIARY_SWITCHES),
-            ): selector.EntitySelector(
-                selector.EntitySelectorConfig(domain="switch", multiple=True)
-            ),
+                default=list(
+                    current.get(CONF_AUXILIARY_SWITCHES, DEFAULT_AUXILIARY_SWITCHES)
+                ),
+            ): _SWITCHES_SELECTOR,
         })
 
         return self.async_show_form(step_id="machine_settings", data_schema=schema)
@@ -338,16 +433,15 @@ class CoffeeRecipeManagerOptionsFlow(config_entries.OptionsFlow):
         if user_input is not None:
             return self.async_create_entry(title="", data=user_input)
 
-        current = {**self._config_entry.data, **self._config_entry.options}
+        current = self._current_config()
         available = _get_machine_drink_options(self.hass, current.get(CONF_MACHINE_DRINK_SELECT))
-        options = [selector.SelectOptionDict(value=d, label=d) for d in available]
         schema = vol.Schema({
             vol.Required(
                 CONF_DRINK_OPTIONS,
-                default=current.get(CONF_DRINK_OPTIONS, available),
+                default=current.get(CONF_DRINK_OPTIONS, list(available)),
             ): selector.SelectSelector(
                 selector.SelectSelectorConfig(
-                    options=options,
+                    options=list(available),
                     multiple=True,
                     mode=selector.SelectSelectorMode.LIST,
                 )
@@ -380,16 +474,12 @@ class CoffeeRecipeManagerOptionsFlow(config_entries.OptionsFlow):
             self._recipe_name = user_input["name"].strip()
             self._recipe_description = user_input.get("description", "")
             self._recipe_steps = []
-            self._step_prefill = []
+            self._step_prefill = ()
             self._step_index = 0
             self._edit_key = None
             return await self.async_step_recipe_step()
 
-        schema = vol.Schema({
-            vol.Required("name"): selector.TextSelector(),
-            vol.Optional("description", default=""): selector.TextSelector(),
-        })
-        return self.async_show_form(step_id="recipe_add", data_schema=schema)
+        return self.async_show_form(step_id="recipe_add", data_schema=_RECIPE_ADD_SCHEMA)
 
     # ------------------------------------------------------------------
     # Shared step builder (add + edit reuse this)
@@ -402,21 +492,21 @@ class CoffeeRecipeManagerOptionsFlow(config_entries.OptionsFlow):
         errors: dict[str, str] = {}
 
         # Resolved auxiliary switch list for this machine config
-        current_config = {**self._config_entry.data, **self._config_entry.options}
-        aux_switches: list[str] = current_config.get(
+        current_config = self._current_config()
+        aux_switches: Sequence[str] = current_config.get(
             CONF_AUXILIARY_SWITCHES, DEFAULT_AUXILIARY_SWITCHES
         )
 
         if user_input is not None:
             raw_drink = user_input.get("drink", "none")
             drink = "" if (not raw_drink or raw_drink == "none") else raw_drink
-            double = bool(user_input.get("double", False))
-            timeout = int(user_input.get("timeout", 300))
+            double = user_input.get("double", False)  # BooleanSelector yields a bool
+            timeout = int(user_input.get("timeout", 300))  # NumberSelector yields a float
 
             # Collect per-switch counts
             switch_counts: dict[str, int] = {}
-            for i, entity_id in enumerate(aux_switches):
-                raw = user_input.get(f"switch_count_{i}", 0)
+            for key, entity_id in zip(self._count_keys(aux_switches), aux_switches):
+                raw = user_input.get(key, 0)
                 count = int(raw) if raw else 0
                 if count > 0:
                     switch_counts[entity_id] = count
@@ -440,93 +530,74 @@ class CoffeeRecipeManagerOptionsFlow(config_entries.OptionsFlow):
                 return await self._save_current_recipe()
 
         # Pre-fill with existing step when editing
+        step_index = self._step_index
+        prefill_count = len(self._step_prefill)
         prefill: dict = {}
-        if self._step_prefill and self._step_index < len(self._step_prefill):
-            prefill = self._step_prefill[self._step_index]
+        if step_index < prefill_count:
+            prefill = self._step_prefill[step_index]
 
-        more_exist = (
-            self._step_prefill
-            and self._step_index + 1 < len(self._step_prefill)
-        )
+        more_exist = step_index + 1 < prefill_count
 
         # Prefill drink
-        configured_drinks = current_config.get(
-            CONF_DRINK_OPTIONS,
-            _get_machine_drink_options(self.hass, current_config.get(CONF_MACHINE_DRINK_SELECT)),
-        )
-        drink_options = [
-            selector.SelectOptionDict(value="none", label="— None —"),
-        ] + [selector.SelectOptionDict(value=d, label=d) for d in configured_drinks]
         default_drink = prefill.get("drink") or "none"
 
-        # Prefill switch counts (support old switch/switches format)
+        # Prefill switch counts (support old switch/switches format).
+        # Without aux switches there are no count fields to fill.
         existing_switch_counts: dict[str, int] = {}
-        if prefill.get("switch_counts"):
-            existing_switch_counts = dict(prefill["switch_counts"])
-        elif prefill.get("switches"):
-            raw = prefill["switches"]
-            entities = [raw] if isinstance(raw, str) else list(raw)
-            for e in entities:
-                existing_switch_counts[e] = 1
-        elif prefill.get("switch"):
-            existing_switch_counts[prefill["switch"]] = 1
-
-        # Build per-switch friendly name placeholders for data_description
-        sw_name_placeholders: dict[str, str] = {}
-        for i, entity_id in enumerate(aux_switches):
-            state = self.hass.states.get(entity_id)
-            if state and state.name:
-                friendly = state.name
-            else:
-                friendly = entity_id.split(".")[-1].replace("_", " ").title()
-            sw_name_placeholders[f"sw_name_{i}"] = friendly
+        if aux_switches:
+            if prefill.get("switch_counts"):
+                existing_switch_counts = dict(prefill["switch_counts"])
+            elif prefill.get("switches"):
+                raw = prefill["switches"]
+                entities = [raw] if isinstance(raw, str) else list(raw)
+                for e in entities:
+                    existing_switch_counts[e] = 1
+            elif prefill.get("switch"):
+                existing_switch_counts[prefill["switch"]] = 1
+
+        # Per-switch friendly name placeholders (cached) + this step's values
+        placeholders = (
+            self._switch_name_placeholders(aux_switches).copy() if aux_switches else {}
+        )
+        placeholders["step_num"] = str(step_index + 1)
+        placeholders["recipe_name"] = self._recipe_name
 
         # Build schema dynamically
-        schema_dict: dict = {
-            vol.Optional("drink", default=default_drink):
-                selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=drink_options,
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                    )
+        schema_pairs: list[tuple] = [
+            (
+                vol.Optional("drink", default=default_drink),
+                self._drink_selector(),
+            ),
+            (
+                vol.Optional("double", default=bool(prefill.get("double", False))),
+                _BOOLEAN_SELECTOR,
+            ),
+        ]
+        append = schema_pairs.append
+        schema_pairs.extend(
+            (
+                vol.Optional(
+                    key,
+                    default=int(existing_switch_counts.get(entity_id, 0)),
                 ),
-            vol.Optional("double", default=bool(prefill.get("double", False))):
-                selector.BooleanSelector(),
-        }
-
-        for i, entity_id in enumerate(aux_switches):
-            default_count = existing_switch_counts.get(entity_id, 0)
-            schema_dict[vol.Optional(f"switch_count_{i}", default=int(default_count))] = (
-                selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=0, max=10, step=1,
-                        mode=selector.NumberSelectorMode.BOX,
-                    )
-                )
-            )
-
-        schema_dict[vol.Optional("timeout", default=int(prefill.get("timeout", 300)))] = (
-            selector.NumberSelector(
-                selector.NumberSelectorConfig(
-                    min=10, max=3600, step=10,
-                    unit_of_measurement="s",
-                    mode=selector.NumberSelectorMode.BOX,
-                )
+                _SWITCH_COUNT_SELECTOR,
             )
+            for key, entity_id in zip(self._count_keys(aux_switches), aux_switches)
         )
-        schema_dict[vol.Optional("add_another", default=bool(more_exist))] = (
-            selector.BooleanSelector()
-        )
+        append((
+            vol.Optional("timeout", default=int(prefill.get("timeout", 300))),
+            _TIMEOUT_SELECTOR,
+        ))
+        append((
+            vol.Optional("add_another", default=more_exist),
+            _BOOLEAN_SELECTOR,
+        ))
 
         return self.async_show_form(
             step_id="recipe_step",
-            data_schema=vol.Schema(schema_dict),
+            data_schema=vol.Schema(dict(schema_pairs)),
             errors=errors,
-            description_placeholders={
-                "step_num": str(self._step_index + 1),
-                "recipe_name": self._recipe_name,
-                **sw_name_placeholders,
-            },
+            description_placeholders=placeholders,
         )
 
     # ------------------------------------------------------------------
@@ -563,17 +634,18 @@ class CoffeeRecipeManagerOptionsFlow(config_entries.OptionsFlow):
             self._recipe_name = user_input["name"].strip()
             self._recipe_description = user_input.get("description", "")
             self._recipe_steps = []
-            self._step_prefill = list(existing.get("steps", []))
+            self._step_prefill = existing.get("steps") or ()
             self._step_index = 0
             return await self.async_step_recipe_step()
 
+        # Per-render name default: clearing the name keeps the stored one
         schema = vol.Schema({
-            vol.Required("name", default=existing.get("name", "")): selector.TextSelector(),
-            vol.Optional("description", default=existing.get("description", "")): selector.TextSelector(),
+            vol.Required("name", default=existing.get("name", "")): _TEXT_SELECTOR,
+            vol.Optional("description", default=""): _TEXT_SELECTOR,
         })
         return self.async_show_form(
             step_id="recipe_edit",
-            data_schema=schema,
+            data_schema=self.add_suggested_values_to_schema(schema, existing),
             description_placeholders={"recipe_key": self._edit_key},
         )
 
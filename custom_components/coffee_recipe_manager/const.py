@@ -24,13 +24,13 @@ DEFAULT_STEP_TIMEOUT = 120  # seconds
 DEFAULT_START_TIMEOUT = 30  # seconds to wait for machine to leave standby after start command
 DEFAULT_RECIPES_FILE = "coffee_recipes.yaml"
 
-DEFAULT_AUXILIARY_SWITCHES: list[str] = [
+DEFAULT_AUXILIARY_SWITCHES: tuple[str, ...] = (
     "switch.coffee_machine_milkfrothing",
     "switch.coffee_machine_hotwaterdispensing",
     "switch.coffee_machine_espressoshot",
-]
+)
 
-DEFAULT_FAULT_SENSORS = [
+DEFAULT_FAULT_SENSORS: tuple[str, ...] = (
     "binary_sensor.coffee_machine_fault_water_empty",
     "binary_sensor.coffee_machine_fault_residual_full",
     "binary_sensor.coffee_machine_fault_milkcup_missing",
@@ -38,11 +38,10 @@ DEFAULT_FAULT_SENSORS = [
     "binary_sensor.coffee_machine_fault_watertank_misplaced",
     "binary_sensor.coffee_machine_fault_blocking",
     "binary_sensor.coffee_machine_fault_heating_fault",
-    "binary_sensor.coffee_machine_fault_milkcup_missing",
     "binary_sensor.coffee_machine_fault_nic_fault",
-]
+)
 
-DRINK_OPTIONS = [
+DRINK_OPTIONS: tuple[str, ...] = (
     "Espresso",
     "Americano",
     "CafeLatte",
@@ -59,7 +58,7 @@ DRINK_OPTIONS = [
     "HotMilk",
     "TravelMug",
     "Cappuccino",
-]
+)
 
 # Recipe executor states
 EXECUTOR_IDLE = "idle"
@@ -92,3 +91,4 @@ ATTR_BREW_COUNT = "brew_count"
 # Persistent storage
 BREW_STATS_STORE_KEY = f"{DOMAIN}.brew_stats"
 BREW_STATS_STORE_VERSION = 1
+BREW_STATS_SAVE_DELAY = 10  # seconds; coalesces stats writes from back-to-back brews
@@ -2,15 +2,18 @@
 from __future__ import annotations
 
 import asyncio
+from datetime import datetime
+from functools import partial
 import logging
-from datetime import datetime, timezone
-from typing import Any, Callable
+from typing import Callable
 
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
 
 from .const import (
+    BREW_STATS_SAVE_DELAY,
     BREW_STATS_STORE_KEY,
     BREW_STATS_STORE_VERSION,
     DEFAULT_START_TIMEOUT,
@@ -29,6 +32,58 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Grace period (s) added on top of a step's timeout while waiting for completion
+_SETTLE_WINDOW = 5
+
+
+def _parse_switch_runs(step: dict) -> tuple[tuple[str, int], ...]:
+    """
+    Return the step's (entity_id, run count) pairs.
+
+    Supports three formats (newest first):
+      switch_counts: {"entity_id": N, ...}  (UI / v0.3.3, per-switch repeat count)
+      switches: ["entity1", ...]             (UI / v0.3.2, list, each run once)
+      switch: "entity_id"                    (YAML / legacy, single, run once)
+    """
+    if counts := step.get("switch_counts"):
+        return tuple(
+            (entity_id, n)
+            for entity_id, count in counts.items()
+            if (n := int(count) if count else 0) > 0
+        )
+    if raw := step.get("switches"):
+        if isinstance(raw, str):
+            return ((raw, 1),)
+        return tuple((entity_id, 1) for entity_id in raw)
+    if switch_entity := step.get("switch"):
+        return ((switch_entity, 1),)
+    return ()
+
+
+class _FaultWaiter:
+    """An in-progress completion wait that a fault trip should interrupt."""
+
+    __slots__ = ("done", "fault")
+
+    def __init__(self) -> None:
+        self.done = asyncio.Event()
+        self.fault: str | None = None  # first fault seen, e.g. "binary_sensor.x = on"
+
+
+class _SwitchCtx(_FaultWaiter):
+    """State of one aux switch run, updated by RecipeExecutor._on_switch_state."""
+
+    __slots__ = ("entity", "ms_entity", "aux", "ms")
+
+    def __init__(self, entity: str, ms_entity: str) -> None:
+        super().__init__()
+        self.entity = entity
+        self.ms_entity = ms_entity
+        # Each entity transitions: unknown → on → done (off after being on).
+        # An entity that starts OFF (idle) is "unknown", not "done".
+        self.aux = "unknown"
+        self.ms = "unknown"
+
 
 class RecipeExecutor:
     """Executes coffee recipes step by step with fault monitoring."""
@@ -51,11 +106,39 @@ class RecipeExecutor:
         self._last_recipe: str | None = None
         self._current_step_drink: str | None = None
         self._last_completed_at: str | None = None
+        # Copy-on-write: replaced (never mutated) on each completed brew, so the
+        # property can hand it out without copying
         self._brew_count: dict[str, int] = {}
+        # Set by abort(); the running task is also cancelled, which interrupts
+        # whatever it is awaiting (this flag only guards the step loops)
         self._abort_event = asyncio.Event()
         self._task: asyncio.Task | None = None
         self._fault_unsub = None
         self._store = Store(hass, BREW_STATS_STORE_VERSION, BREW_STATS_STORE_KEY)
+        self._stats_pending = False  # a delayed stats save is scheduled
+        # Fault sensors that are currently "on" (entity_id -> friendly name),
+        # kept up to date by one long-lived listener instead of polling states
+        self._fault_sensors: tuple[str, ...] = tuple(config.get("fault_sensors", ()))
+        # drink select entity -> (state.last_updated, option set, lower-case -> option);
+        # last_updated changes on any state or attribute change (same rule as config_flow)
+        self._drink_lookup_cache: dict[
+            str, tuple[datetime, frozenset[str], dict[str, str]]
+        ] = {}
+        # In-progress completion waits, tripped by _on_fault_change
+        self._fault_waiters: list[_FaultWaiter] = []
+        self._active_faults: dict[str, str] = {}
+        self._faults_cleared = asyncio.Event()
+        self._faults_cleared.set()
+        self._fault_watch_unsub: Callable | None = None
+        # "notify.mobile_app_x" split once into (domain, service); None = no push
+        self._notify_target: tuple[str, str] | None = None
+        notify_service = config.get("notify_service", "")
+        if notify_service and notify_service != "none":
+            domain, _, service = notify_service.rpartition(".")
+            if domain and service:
+                self._notify_target = (domain, service)
+            else:
+                _LOGGER.warning("Invalid notify service '%s' — mobile push disabled", notify_service)
 
     # ------------------------------------------------------------------
     # Public properties
@@ -95,14 +178,22 @@ class RecipeExecutor:
 
     @property
     def brew_count(self) -> dict[str, int]:
-        return dict(self._brew_count)
+        """Per-recipe brew counts (shared snapshot — do not mutate)."""
+        return self._brew_count
 
     # ------------------------------------------------------------------
     # Initialization (persistent storage)
     # ------------------------------------------------------------------
 
     async def async_initialize(self) -> None:
-        """Load persisted brew stats from storage."""
+        """Load persisted brew stats and start tracking fault sensors."""
+        for sensor_id in self._fault_sensors:
+            self._update_fault(sensor_id, self.hass.states.get(sensor_id))
+        if self._fault_sensors:
+            self._fault_watch_unsub = async_track_state_change_event(
+                self.hass, self._fault_sensors, self._on_fault_change
+            )
+
         data = await self._store.async_load()
         if data:
             self._last_recipe = data.get("last_recipe")
@@ -113,13 +204,34 @@ class RecipeExecutor:
                 self._last_recipe, self._brew_count,
             )
 
-    async def _save_stats(self) -> None:
-        """Persist brew stats."""
-        await self._store.async_save({
+    def _stats_data(self) -> dict:
+        """Return the brew stats snapshot to persist."""
+        self._stats_pending = False
+        return {
             "last_recipe": self._last_recipe,
             "last_completed_at": self._last_completed_at,
             "brew_count": self._brew_count,
-        })
+        }
+
+    def _schedule_save_stats(self) -> None:
+        """Coalesce stats writes: back-to-back brews hit disk once."""
+        self._stats_pending = True
+        self._store.async_delay_save(self._stats_data, BREW_STATS_SAVE_DELAY)
+
+    @callback
+    def async_stop_fault_watch(self) -> None:
+        """Unsubscribe the fault sensor listener (safe to call more than once)."""
+        if self._fault_watch_unsub:
+            self._fault_watch_unsub()
+            self._fault_watch_unsub = None
+
+    async def async_shutdown(self) -> None:
+        """Stop fault tracking and flush a pending stats save."""
+        self.async_stop_fault_watch()
+        if self._stats_pending:
+            # async_save also cancels the pending delayed write
+            await self._store.async_save(self._stats_data())
+            self._stats_pending = False
 
     async def brew(self, recipe_name: str, steps: list[dict]) -> None:
         """Start brewing a recipe. Aborts any running recipe first."""
@@ -145,11 +257,10 @@ class RecipeExecutor:
         """Abort currently running recipe."""
         _LOGGER.info("Aborting recipe: %s", self._current_recipe)
         self._abort_event.set()
-        if self._task:
-            try:
-                await asyncio.wait_for(asyncio.shield(self._task), timeout=5)
-            except (asyncio.TimeoutError, asyncio.CancelledError):
-                self._task.cancel()
+        if self._task and not self._task.done():
+            self._task.cancel()
+            # asyncio.wait doesn't raise the task's CancelledError into us
+            await asyncio.wait([self._task], timeout=5)
         self._cleanup()
         self._set_status(EXECUTOR_IDLE)
 
@@ -185,16 +296,20 @@ class RecipeExecutor:
 
             # All steps done
             self._last_recipe = recipe_name
-            self._last_completed_at = datetime.now(timezone.utc).isoformat()
-            self._brew_count[recipe_name] = self._brew_count.get(recipe_name, 0) + 1
+            self._last_completed_at = dt_util.utcnow().isoformat(timespec="seconds")
+            self._brew_count = {
+                **self._brew_count,
+                recipe_name: self._brew_count.get(recipe_name, 0) + 1,
+            }
             self._current_step_drink = None
             self._set_status(EXECUTOR_COMPLETED)
             self.hass.bus.async_fire(EVENT_RECIPE_COMPLETED, {"recipe": recipe_name})
             _LOGGER.info("Recipe '%s' completed successfully", recipe_name)
-            self.hass.async_create_task(self._save_stats())
+            self._schedule_save_stats()
 
         except asyncio.CancelledError:
-            _LOGGER.info("Recipe task cancelled")
+            _LOGGER.info("Recipe '%s' aborted", recipe_name)
+            self._set_status(EXECUTOR_IDLE)
         except Exception as exc:  # noqa: BLE001
             _LOGGER.exception("Unexpected error in recipe '%s'", recipe_name)
             await self._fail(str(exc))
@@ -203,31 +318,22 @@ class RecipeExecutor:
 
     async def _execute_step(self, step: dict) -> bool:
         """Execute one step with automatic fault-wait-resume. Returns True if ok."""
-        switch_entity = step.get("switch")
+        if not (
+            step.get("drink")
+            or step.get("switch")
+            or step.get("switches")
+            or step.get("switch_counts")
+        ):
+            _LOGGER.warning("Step has no 'drink' or switch action, skipping: %s", step)
+            return True
+
         drink = step.get("drink")
         double = step.get("double", False)
         timeout = step.get("timeout", DEFAULT_STEP_TIMEOUT)
 
         # ── Switch step(s) ──────────────────────────────────────────────────
-        # Supports three formats (newest first):
-        #   switch_counts: {"entity_id": N, ...}  (UI / v0.3.3, per-switch repeat count)
-        #   switches: ["entity1", ...]             (UI / v0.3.2, list, each run once)
-        #   switch: "entity_id"                    (YAML / legacy, single, run once)
-        #
-        # Builds a list of (entity_id, count) pairs, then executes each
-        # entity sequentially the specified number of times.
-        switch_runs: list[tuple[str, int]] = []
-        if step.get("switch_counts"):
-            for entity_id, count in step["switch_counts"].items():
-                n = int(count) if count else 0
-                if n > 0:
-                    switch_runs.append((entity_id, n))
-        elif step.get("switches"):
-            raw = step["switches"]
-            entities = [raw] if isinstance(raw, str) else list(raw)
-            switch_runs = [(e, 1) for e in entities]
-        elif switch_entity:
-            switch_runs = [(switch_entity, 1)]
+        # (entity_id, count) pairs, executed sequentially after the drink
+        switch_runs = _parse_switch_runs(step)
 
         # ── Drink step first ────────────────────────────────────────────────
         if drink:
@@ -242,6 +348,17 @@ class RecipeExecutor:
                 )
                 return False
 
+            # Resolve entities once; fault retries below loop back to step 1
+            start_entity = self.config["machine_start_switch"]
+            double_entity = self.config.get("machine_double_switch")
+            if double_entity and self.hass.states.get(double_entity) is None:
+                _LOGGER.warning(
+                    "Double switch entity '%s' not found — skipping double setting",
+                    double_entity,
+                )
+                double_entity = None
+            double_service = "turn_on" if double else "turn_off"
+
             while True:
                 if self._abort_event.is_set():
                     self._set_status(EXECUTOR_IDLE)
@@ -250,9 +367,7 @@ class RecipeExecutor:
                 # 1. Check faults BEFORE starting — wait until cleared
                 fault = self._get_active_fault()
                 if fault:
-                    cleared = await self._wait_for_fault_clear(fault)
-                    if not cleared:
-                        return False
+                    await self._wait_for_fault_clear(fault)
                     continue
 
                 # 2. Select drink
@@ -265,26 +380,17 @@ class RecipeExecutor:
                 )
 
                 # 3. Set double if needed
-                double_entity = self.config.get("machine_double_switch")
                 if double_entity:
-                    if self.hass.states.get(double_entity) is None:
-                        _LOGGER.warning(
-                            "Double switch entity '%s' not found — skipping double setting",
-                            double_entity,
-                        )
-                    else:
-                        service = "turn_on" if double else "turn_off"
-                        await self.hass.services.async_call(
-                            "switch", service,
-                            {"entity_id": double_entity},
-                            blocking=True,
-                        )
+                    await self.hass.services.async_call(
+                        "switch", double_service,
+                        {"entity_id": double_entity},
+                        blocking=True,
+                    )
 
                 # Small delay to let machine accept settings
                 await asyncio.sleep(2)
 
                 # 4. Start
-                start_entity = self.config["machine_start_switch"]
                 await self.hass.services.async_call(
                     "switch", "turn_on",
                     {"entity_id": start_entity},
@@ -302,19 +408,23 @@ class RecipeExecutor:
                         self._current_recipe, self._current_step,
                     )
                     continue
-                else:  # "abort" or "timeout"
+                else:  # "timeout"
                     return False
 
         # ── Switch step(s) after drink ───────────────────────────────────────
         if switch_runs:
-            # Validate all entities before starting
-            for entity_id, _ in switch_runs:
-                if self.hass.states.get(entity_id) is None:
-                    await self._fail(
-                        f"Switch entity '{entity_id}' not found. "
-                        f"Check the entity ID in the recipe."
-                    )
-                    return False
+            # Validate all entities before starting (one pass, first missing wins)
+            states_get = self.hass.states.get
+            missing = next(
+                (entity_id for entity_id, _ in switch_runs if states_get(entity_id) is None),
+                None,
+            )
+            if missing is not None:
+                await self._fail(
+                    f"Switch entity '{missing}' not found. "
+                    f"Check the entity ID in the recipe."
+                )
+                return False
 
             # Execute each switch the required number of times, in sequence
             for entity_id, count in switch_runs:
@@ -336,9 +446,7 @@ class RecipeExecutor:
 
                         fault = self._get_active_fault()
                         if fault:
-                            cleared = await self._wait_for_fault_clear(fault)
-                            if not cleared:
-                                return False
+                            await self._wait_for_fault_clear(fault)
                             continue
 
                         self._current_step_drink = entity_id
@@ -385,6 +493,7 @@ class RecipeExecutor:
                     entity_id, count,
                 )
 
+        # Switch keys present but nothing runnable (e.g. every count is 0)
         if not drink and not switch_runs:
             _LOGGER.warning("Step has no 'drink' or switch action, skipping: %s", step)
 
@@ -399,78 +508,43 @@ class RecipeExecutor:
           • machine_start_switch going OFF   (machine reports it finished the operation)
         whichever happens first.
 
-        Stage 1 – send turn_on, then wait minimum 5s.
-                  If either completion signal fires within 5s → fast complete.
-        Stage 2 – wait up to `timeout` seconds for either completion signal.
+        Sends turn_on, then waits up to `timeout` (+ _SETTLE_WINDOW) seconds
+        for the completion signal; a fast completion returns immediately.
 
-        Returns: "ok" | "abort" | "timeout" | "retry"
+        Returns: "ok" | "timeout" | "retry"; an abort cancels the task instead.
         """
         machine_start_entity = self.config["machine_start_switch"]
-        fault_sensors = self.config.get("fault_sensors", [])
 
-        done_event = asyncio.Event()   # BOTH aux switch AND machine_start completed (ON→OFF)
-        fault_detected: list[str] = []
-        # Each entity transitions: unknown → on → done (off after being on).
-        # An entity that starts OFF (idle) is "unknown", not "done".
-        aux_state = "unknown"        # "unknown" | "on" | "done"
-        machine_start_state = "unknown"
-
-        @callback
-        def _state_listener(event):
-            nonlocal aux_state, machine_start_state
-            entity = event.data.get("entity_id", "")
-            new_state = event.data.get("new_state")
-            if new_state is None:
-                return
-            val = new_state.state
-            _LOGGER.debug(
-                "[CRM] state_listener: entity=%s old=%s new=%s aux_state=%s ms_state=%s",
-                entity,
-                event.data.get("old_state").state if event.data.get("old_state") else "?",
-                val, aux_state, machine_start_state,
-            )
-            if entity == entity_id:
-                if val == "on":
-                    aux_state = "on"
-                elif val == "off" and aux_state == "on":
-                    aux_state = "done"
-            elif entity == machine_start_entity:
-                if val == "on":
-                    machine_start_state = "on"
-                elif val == "off" and machine_start_state == "on":
-                    machine_start_state = "done"
-            elif entity in fault_sensors and val == "on":
-                fault_detected.append(f"{entity} = on")
-                done_event.set()
-                return
-            if aux_state == "done" and machine_start_state == "done":
-                _LOGGER.debug("[CRM] both aux and machine_start completed (ON→OFF) → done")
-                done_event.set()
-
-        entities_to_watch = [entity_id, machine_start_entity] + list(fault_sensors)
-        unsub = async_track_state_change_event(self.hass, entities_to_watch, _state_listener)
+        ctx = _SwitchCtx(entity_id, machine_start_entity)
+
+        # Fault sensors are watched by the executor-wide listener (_on_fault_change)
+        unsub = async_track_state_change_event(
+            self.hass, (entity_id, machine_start_entity), partial(self._on_switch_state, ctx)
+        )
+        self._fault_waiters.append(ctx)
 
         try:
             # Check faults before starting
             fault = self._get_active_fault()
             if fault:
-                cleared = await self._wait_for_fault_clear(fault)
-                return "retry" if cleared else "abort"
+                await self._wait_for_fault_clear(fault)
+                return "retry"
 
             ms = self.hass.states.get(machine_start_entity)
             aux = self.hass.states.get(entity_id)
-            _LOGGER.debug(
-                "[CRM] _run_switch_once PRE-CHECK entity=%s state=%s machine_start=%s",
-                entity_id,
-                aux.state if aux else "unavailable",
-                ms.state if ms else "unavailable",
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "[CRM] _run_switch_once PRE-CHECK entity=%s state=%s machine_start=%s",
+                    entity_id,
+                    aux.state if aux else "unavailable",
+                    ms.state if ms else "unavailable",
+                )
             # If already ON before turn_on (e.g. machine is mid-operation from a
             # previous run) — mark as "on" so the upcoming OFF transition is recognised.
             if aux and aux.state == "on":
-                aux_state = "on"
+                ctx.aux = "on"
             if ms and ms.state == "on":
-                machine_start_state = "on"
+                ctx.ms = "on"
             # Note: if both are OFF (idle state) we leave states as "unknown" —
             # we must observe ON→OFF before counting as complete.
 
@@ -481,209 +555,164 @@ class RecipeExecutor:
                 {"entity_id": entity_id},
                 blocking=True,
             )
-            ms_after = self.hass.states.get(machine_start_entity)
-            aux_after = self.hass.states.get(entity_id)
-            _LOGGER.debug(
-                "[CRM] after turn_on entity=%s state=%s machine_start=%s",
-                entity_id,
-                aux_after.state if aux_after else "unavailable",
-                ms_after.state if ms_after else "unavailable",
-            )
-
-            # ── Stage 1: wait minimum 5s (or either completion signal) ─────
-            _LOGGER.debug(
-                "[CRM] Stage 1: waiting 5s min (or aux/machine_start OFF) entity=%s",
-                entity_id,
-            )
-            abort_task = self.hass.async_create_task(self._abort_event.wait())
-            done_task = self.hass.async_create_task(done_event.wait())
-
-            done_s1, pending = await asyncio.wait(
-                [abort_task, done_task],
-                timeout=5,
-                return_when=asyncio.FIRST_COMPLETED,
-            )
-            for t in pending:
-                t.cancel()
-
-            _LOGGER.debug(
-                "[CRM] Stage 1 finished: abort=%s done_event=%s fault=%s",
-                self._abort_event.is_set(), done_event.is_set(), fault_detected,
-            )
-
-            if self._abort_event.is_set():
-                self._set_status(EXECUTOR_IDLE)
-                return "abort"
-
-            if fault_detected:
-                cleared = await self._wait_for_fault_clear(", ".join(fault_detected))
-                return "retry" if cleared else "abort"
-
-            if done_event.is_set():
-                _LOGGER.debug("[CRM] fast complete in Stage 1 entity=%s", entity_id)
-                return "ok"
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                # Re-read purely for the log line; skipped unless debugging
+                ms_after = self.hass.states.get(machine_start_entity)
+                aux_after = self.hass.states.get(entity_id)
+                _LOGGER.debug(
+                    "[CRM] after turn_on entity=%s state=%s machine_start=%s",
+                    entity_id,
+                    aux_after.state if aux_after else "unavailable",
+                    ms_after.state if ms_after else "unavailable",
+                )
 
-            # ── Stage 2: wait for either completion signal ─────────────────
+            # ── Wait for both completion signals (or fault) ──────────────
+            # One timeout covers the former 5s fast-complete stage plus the step timeout.
             _LOGGER.debug(
-                "[CRM] Stage 2: waiting up to %ds for aux/machine_start OFF entity=%s",
-                timeout, entity_id,
-            )
-            abort_task = self.hass.async_create_task(self._abort_event.wait())
-            done_task = self.hass.async_create_task(done_event.wait())
-
-            done_s2, pending = await asyncio.wait(
-                [abort_task, done_task],
-                timeout=timeout,
-                return_when=asyncio.FIRST_COMPLETED,
+                "[CRM] waiting up to %ds for aux/machine_start OFF entity=%s",
+                timeout + _SETTLE_WINDOW, entity_id,
             )
-            for t in pending:
-                t.cancel()
+            wait_start = self.hass.loop.time()
+            finished = await self._wait_done(ctx.done, timeout + _SETTLE_WINDOW)
+            elapsed = self.hass.loop.time() - wait_start
 
             _LOGGER.debug(
-                "[CRM] Stage 2 finished: abort=%s done_s2_count=%d done_event=%s fault=%s",
-                self._abort_event.is_set(), len(done_s2), done_event.is_set(), fault_detected,
+                "[CRM] wait finished after %.1fs: finished=%s fault=%s",
+                elapsed, finished, ctx.fault,
             )
 
-            if not done_s2:
+            if not finished:
                 await self._fail(
                     f"Timeout after {timeout}s waiting for machine to finish '{entity_id}'"
                 )
                 return "timeout"
 
-            if self._abort_event.is_set():
-                self._set_status(EXECUTOR_IDLE)
-                return "abort"
-
-            if fault_detected:
-                cleared = await self._wait_for_fault_clear(", ".join(fault_detected))
-                return "retry" if cleared else "abort"
+            if ctx.fault:
+                await self._wait_for_fault_clear(ctx.fault)
+                return "retry"
 
-            _LOGGER.debug("[CRM] Stage 2: done OK entity=%s", entity_id)
+            _LOGGER.debug("[CRM] done OK entity=%s", entity_id)
             return "ok"
 
         finally:
             unsub()
+            self._fault_waiters.remove(ctx)
 
     async def _wait_for_completion(self, timeout: int, start_entity: str | None = None) -> str:
         """
         Wait until machine finishes brewing.
 
-        Uses machine_start_switch as the completion signal:
-          Stage 1 – wait minimum 5s; if machine_start goes OFF sooner → fast complete.
-          Stage 2 – wait for machine_start to go OFF (brew finished). Uses per-step timeout.
+        Uses machine_start_switch going OFF as the completion signal, waiting
+        up to `timeout` (+ _SETTLE_WINDOW) seconds; fast dispenses return immediately.
 
-        Monitors: machine_start_switch changes, fault sensors, abort event.
-        Returns: "ok" | "abort" | "timeout" | "retry" (fault cleared, retry step).
+        Monitors: machine_start_switch changes and fault sensors.
+        Returns: "ok" | "timeout" | "retry" (fault cleared, retry step).
+        An abort cancels the task instead.
         """
         if start_entity is None:
             start_entity = self.config["machine_start_switch"]
-        fault_sensors = self.config.get("fault_sensors", [])
 
-        done_event = asyncio.Event()   # start switch turned OFF → brew finished
-        fault_detected: list[str] = []
+        waiter = _FaultWaiter()
 
-        @callback
-        def _state_listener(event):
-            entity_id = event.data.get("entity_id", "")
-            new_state = event.data.get("new_state")
-            old_state = event.data.get("old_state")
-            if new_state is None:
-                return
-            old_val = old_state.state if old_state else "?"
-            new_val = new_state.state
-            if entity_id == start_entity:
-                _LOGGER.debug(
-                    "start_switch changed: %s → %s  (recipe='%s' step=%d)",
-                    old_val, new_val, self._current_recipe, self._current_step,
-                )
-                if new_val == "off":
-                    done_event.set()
-            elif entity_id in fault_sensors and new_val == "on":
-                fault_detected.append(f"{entity_id} = on")
-                done_event.set()
-
-        entities_to_watch = [start_entity] + list(fault_sensors)
-        unsub = async_track_state_change_event(self.hass, entities_to_watch, _state_listener)
+        # Fault sensors are watched by the executor-wide listener (_on_fault_change)
+        unsub = async_track_state_change_event(
+            self.hass, start_entity, partial(self._on_start_switch_state, waiter)
+        )
+        self._fault_waiters.append(waiter)
 
         try:
             # Check faults immediately before waiting
             fault = self._get_active_fault()
             if fault:
-                cleared = await self._wait_for_fault_clear(fault)
-                return "retry" if cleared else "abort"
+                await self._wait_for_fault_clear(fault)
+                return "retry"
 
-            # ── Stage 1: wait minimum 5s (or machine_start OFF) ─────────────
+            # ── Wait for start switch OFF (or fault) ────────────────────────
+            # One timeout covers the former 5s fast-dispense stage plus the step timeout.
             _LOGGER.debug(
-                "Stage 1: waiting 5s min (or start switch OFF)  (recipe='%s' step=%d)",
-                self._current_recipe, self._current_step,
-            )
-            abort_task = self.hass.async_create_task(self._abort_event.wait())
-            done_task = self.hass.async_create_task(done_event.wait())
-
-            done_s1, pending = await asyncio.wait(
-                [abort_task, done_task],
-                timeout=5,
-                return_when=asyncio.FIRST_COMPLETED,
-            )
-            for t in pending:
-                t.cancel()
-
-            if self._abort_event.is_set():
-                self._set_status(EXECUTOR_IDLE)
-                return "abort"
-
-            if fault_detected:
-                cleared = await self._wait_for_fault_clear(", ".join(fault_detected))
-                return "retry" if cleared else "abort"
-
-            if done_event.is_set():
-                _LOGGER.debug(
-                    "Stage 1: start switch OFF (fast-dispense)  (recipe='%s' step=%d)",
-                    self._current_recipe, self._current_step,
-                )
-                return "ok"
-
-            # ── Stage 2: wait for start switch to turn OFF ───────────────────
-            _LOGGER.debug(
-                "Stage 2: waiting for start switch OFF  (recipe='%s' step=%d timeout=%ds)",
-                self._current_recipe, self._current_step, timeout,
-            )
-            abort_task = self.hass.async_create_task(self._abort_event.wait())
-            done_task = self.hass.async_create_task(done_event.wait())
-
-            done_s2, pending = await asyncio.wait(
-                [abort_task, done_task],
-                timeout=timeout,
-                return_when=asyncio.FIRST_COMPLETED,
+                "Waiting for start switch OFF  (recipe='%s' step=%d timeout=%ds)",
+                self._current_recipe, self._current_step, timeout + _SETTLE_WINDOW,
             )
-            for t in pending:
-                t.cancel()
+            finished = await self._wait_done(waiter.done, timeout + _SETTLE_WINDOW)
 
-            if not done_s2:
+            if not finished:
                 await self._fail(f"Timeout after {timeout}s waiting for machine to finish")
                 return "timeout"
 
-            if self._abort_event.is_set():
-                self._set_status(EXECUTOR_IDLE)
-                return "abort"
-
-            if fault_detected:
-                cleared = await self._wait_for_fault_clear(", ".join(fault_detected))
-                return "retry" if cleared else "abort"
+            if waiter.fault:
+                await self._wait_for_fault_clear(waiter.fault)
+                return "retry"
 
             _LOGGER.debug(
-                "Stage 2 done: start switch OFF  (recipe='%s' step=%d)",
+                "Start switch OFF  (recipe='%s' step=%d)",
                 self._current_recipe, self._current_step,
             )
             return "ok"
 
         finally:
             unsub()
+            self._fault_waiters.remove(waiter)
+
+    @callback
+    def _on_switch_state(self, ctx: _SwitchCtx, event) -> None:
+        """Advance an aux switch run; done once both switches went ON→OFF."""
+        new_state = event.data.get("new_state")
+        if new_state is None:
+            return
+        entity = event.data.get("entity_id", "")
+        val = new_state.state
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            old_state = event.data.get("old_state")
+            _LOGGER.debug(
+                "[CRM] state_listener: entity=%s old=%s new=%s aux_state=%s ms_state=%s",
+                entity,
+                old_state.state if old_state else "?",
+                val, ctx.aux, ctx.ms,
+            )
+        if entity == ctx.entity:
+            if val == "on":
+                ctx.aux = "on"
+            elif val == "off" and ctx.aux == "on":
+                ctx.aux = "done"
+        elif entity == ctx.ms_entity:
+            if val == "on":
+                ctx.ms = "on"
+            elif val == "off" and ctx.ms == "on":
+                ctx.ms = "done"
+        if ctx.aux == "done" and ctx.ms == "done":
+            _LOGGER.debug("[CRM] both aux and machine_start completed (ON→OFF) → done")
+            ctx.done.set()
+
+    @callback
+    def _on_start_switch_state(self, waiter: _FaultWaiter, event) -> None:
+        """Finish a brew wait when the (only tracked) start switch turns OFF."""
+        new_state = event.data.get("new_state")
+        if new_state is None:
+            return
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            old_state = event.data.get("old_state")
+            _LOGGER.debug(
+                "start_switch changed: %s → %s  (recipe='%s' step=%d)",
+                old_state.state if old_state else "?", new_state.state,
+                self._current_recipe, self._current_step,
+            )
+        if new_state.state == "off":
+            waiter.done.set()
+
+    @staticmethod
+    async def _wait_done(event: asyncio.Event, timeout: float) -> bool:
+        """Wait for *event*. Returns False on timeout."""
+        try:
+            async with asyncio.timeout(timeout):
+                await event.wait()
+        except TimeoutError:
+            return False
+        return True
 
-    async def _wait_for_fault_clear(self, fault_description: str) -> bool:
+    async def _wait_for_fault_clear(self, fault_description: str) -> None:
         """
         Pause recipe execution and wait until all fault sensors turn off.
-        Sends a notification to the user. Returns True when cleared, False if aborted.
+        Sends a notification to the user. An abort cancels the wait.
         """
         _LOGGER.warning(
             "Recipe '%s' paused at step %d/%d — fault: %s. Waiting for resolution...",
@@ -698,64 +727,59 @@ class RecipeExecutor:
             f"Fix the issue and brewing will resume automatically."
         )
 
-        fault_sensors = self.config.get("fault_sensors", [])
-        clear_event = asyncio.Event()
+        # Already clear?
+        if not self._active_faults:
+            return
 
-        @callback
-        def _fault_clear_listener(event):
-            # Fire the event only when all faults are gone
-            if not self._get_active_fault():
-                clear_event.set()
+        # _faults_cleared is set by _on_fault_change once every fault is off;
+        # abort() cancels the task, which ends this wait
+        await self._faults_cleared.wait()
 
-        unsub = async_track_state_change_event(
-            self.hass, fault_sensors, _fault_clear_listener
+        # Fault cleared — small delay then resume
+        _LOGGER.info(
+            "Fault cleared for recipe '%s' step %d, resuming in 2s...",
+            self._current_recipe, self._current_step,
         )
+        await asyncio.sleep(2)
+        self._set_status(EXECUTOR_RUNNING)
 
-        try:
-            # Already clear?
-            if not self._get_active_fault():
-                return True
-
-            abort_task = self.hass.async_create_task(self._abort_event.wait())
-            clear_task = self.hass.async_create_task(clear_event.wait())
-
-            done, pending = await asyncio.wait(
-                [abort_task, clear_task],
-                return_when=asyncio.FIRST_COMPLETED,
-            )
-
-            for t in pending:
-                t.cancel()
-
-            if self._abort_event.is_set():
-                return False
-
-            # Fault cleared — small delay then resume
-            _LOGGER.info(
-                "Fault cleared for recipe '%s' step %d, resuming in 2s...",
-                self._current_recipe, self._current_step,
-            )
-            await asyncio.sleep(2)
-            self._set_status(EXECUTOR_RUNNING)
-
-            await self._notify(
-                f"✅ Fault resolved. Resuming recipe: {self._current_recipe}\n"
-                f"Step {self._current_step}/{self._total_steps}"
-            )
-            return True
-
-        finally:
-            unsub()
+        await self._notify(
+            f"✅ Fault resolved. Resuming recipe: {self._current_recipe}\n"
+            f"Step {self._current_step}/{self._total_steps}"
+        )
 
     def _get_active_fault(self) -> str | None:
         """Return description of first active fault sensor, or None."""
-        for sensor_id in self.config.get("fault_sensors", []):
-            state = self.hass.states.get(sensor_id)
-            if state and state.state == "on":
-                friendly = state.attributes.get("friendly_name", sensor_id)
-                return friendly
+        active = self._active_faults
+        if active:
+            # Report in configured sensor order, not the order faults tripped in
+            for sensor_id in self._fault_sensors:
+                if sensor_id in active:
+                    return active[sensor_id]
         return None
 
+    def _update_fault(self, sensor_id: str, state) -> None:
+        """Record whether *sensor_id* is currently faulted."""
+        if state is not None and state.state == "on":
+            self._active_faults[sensor_id] = state.attributes.get("friendly_name", sensor_id)
+            self._faults_cleared.clear()
+        else:
+            self._active_faults.pop(sensor_id, None)
+            if not self._active_faults:
+                self._faults_cleared.set()
+
+    @callback
+    def _on_fault_change(self, event) -> None:
+        """Keep _active_faults in sync and interrupt waits when a fault trips."""
+        sensor_id = event.data["entity_id"]
+        new_state = event.data.get("new_state")
+        self._update_fault(sensor_id, new_state)
+        if new_state is not None and new_state.state == "on":
+            for waiter in self._fault_waiters:
+                if waiter.fault is None:
+                    waiter.fault = f"{sensor_id} = on"
+                    waiter.done.set()
+
     async def _fail(self, reason: str) -> None:
         """Mark recipe as failed and send notifications."""
         _LOGGER.error(
@@ -783,28 +807,34 @@ class RecipeExecutor:
     async def _notify(self, message: str) -> None:
         """Send persistent notification + optional mobile push."""
         # Always send persistent notification
-        await self.hass.services.async_call(
-            "persistent_notification", "create",
-            {
-                "title": "Coffee Recipe Manager",
-                "message": message,
-                "notification_id": f"{DOMAIN}_notification",
-            },
-            blocking=False,
-        )
+        calls = [
+            self.hass.services.async_call(
+                "persistent_notification", "create",
+                {
+                    "title": "Coffee Recipe Manager",
+                    "message": message,
+                    "notification_id": f"{DOMAIN}_notification",
+                },
+                blocking=False,
+            )
+        ]
 
-        # Mobile push if configured
-        notify_service = self.config.get("notify_service", "")
-        if notify_service and notify_service != "none":
-            try:
-                domain, service = notify_service.rsplit(".", 1)
-                await self.hass.services.async_call(
+        # Mobile push if configured — dispatched concurrently with the above
+        if self._notify_target:
+            domain, service = self._notify_target
+            calls.append(
+                self.hass.services.async_call(
                     domain, service,
                     {"title": "☕ Coffee Recipe Manager", "message": message},
                     blocking=False,
                 )
-            except Exception as exc:  # noqa: BLE001
-                _LOGGER.warning("Failed to send mobile notification: %s", exc)
+            )
+
+        results = await asyncio.gather(*calls, return_exceptions=True)
+        if isinstance(results[0], BaseException):
+            raise results[0]
+        if len(results) > 1 and isinstance(results[1], Exception):
+            _LOGGER.warning("Failed to send mobile notification: %s", results[1])
 
     def _set_status(self, status: str) -> None:
         self._status = status
@@ -823,7 +853,20 @@ class RecipeExecutor:
         Return the correctly-cased option name for *drink* from the select entity.
         Tries exact match first, then case-insensitive. Returns None if not found.
         """
-        options = self._get_drink_options(drink_entity)
+        state = self.hass.states.get(drink_entity)
+        cached = self._drink_lookup_cache.get(drink_entity)
+        if state is not None and cached is not None and cached[0] == state.last_updated:
+            _, options, by_lower = cached
+        else:
+            raw = state.attributes.get("options", ()) if state else ()
+            options = frozenset(raw)
+            by_lower = {}
+            for opt in raw:
+                by_lower.setdefault(opt.lower(), opt)  # first match wins
+            if state is not None:
+                self._drink_lookup_cache[drink_entity] = (
+                    state.last_updated, options, by_lower
+                )
         if not options:
             # Entity unavailable — can't validate; pass through as-is and let HA decide
             _LOGGER.warning(
@@ -835,16 +878,14 @@ class RecipeExecutor:
         if drink in options:
             return drink
         # Case-insensitive match
-        drink_lower = drink.lower()
-        for opt in options:
-            if opt.lower() == drink_lower:
-                _LOGGER.warning(
-                    "Drink name '%s' matched to '%s' (case-insensitive). "
-                    "Update the recipe to use the exact name.",
-                    drink, opt,
-                )
-                return opt
-        return None
+        opt = by_lower.get(drink.lower())
+        if opt is not None:
+            _LOGGER.warning(
+                "Drink name '%s' matched to '%s' (case-insensitive). "
+                "Update the recipe to use the exact name.",
+                drink, opt,
+            )
+        return opt
 
     def _cleanup(self) -> None:
         self._current_step_drink = None
@@ -20,11 +20,12 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up select entities."""
-    storage: RecipeStorage = hass.data[DOMAIN][entry.entry_id]["storage"]
-    entity = CoffeeRecipeSelect(entry, storage)
+    data = hass.data[DOMAIN][entry.entry_id]
+    storage: RecipeStorage = data["storage"]
+    entity = CoffeeRecipeSelect(entry, storage, data["device_info"])
     async_add_entities([entity])
     # Store reference so button + storage can notify it
-    hass.data[DOMAIN][entry.entry_id]["recipe_select"] = entity
+    data["recipe_select"] = entity
 
 
 class CoffeeRecipeSelect(SelectEntity):
@@ -34,16 +35,23 @@ class CoffeeRecipeSelect(SelectEntity):
     _attr_name = "Select Recipe"
     _attr_icon = "mdi:coffee-outline"
 
-    def __init__(self, entry: ConfigEntry, storage: RecipeStorage) -> None:
+    def __init__(self, entry: ConfigEntry, storage: RecipeStorage, device_info: dict) -> None:
         self._entry = entry
         self._storage = storage
+        self._device_info = device_info
         self._attr_unique_id = f"{entry.entry_id}_recipe_select"
         self._current_option: str | None = None
+        # Options as last written to HA; reload_options skips no-op refreshes
+        self._last_options: tuple[str, ...] = tuple(self.options)
 
     # ------------------------------------------------------------------
 
     def reload_options(self) -> None:
-        """Re-read recipe list from storage and refresh entity."""
+        """Re-read recipe list from storage and refresh entity if it changed."""
+        options = tuple(self.options)
+        if options == self._last_options:
+            return
+        self._last_options = options
         self.schedule_update_ha_state()
 
     @property
@@ -74,9 +82,4 @@ class CoffeeRecipeSelect(SelectEntity):
 
     @property
     def device_info(self) -> dict:
-        return {
-            "identifiers": {(DOMAIN, self._entry.entry_id)},
-            "name": "Coffee Recipe Manager",
-            "manufacturer": "VahaC",
-            "model": "Recipe Manager",
-        }
+        return self._device_info
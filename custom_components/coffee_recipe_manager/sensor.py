@@ -30,8 +30,8 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up sensor entities."""
-    executor = hass.data[DOMAIN][entry.entry_id]["executor"]
-    async_add_entities([CoffeeRecipeStatusSensor(entry, executor)])
+    data = hass.data[DOMAIN][entry.entry_id]
+    async_add_entities([CoffeeRecipeStatusSensor(entry, data["executor"], data["device_info"])])
 
 
 class CoffeeRecipeStatusSensor(SensorEntity):
@@ -41,9 +41,10 @@ class CoffeeRecipeStatusSensor(SensorEntity):
     _attr_name = "Recipe Status"
     _attr_icon = "mdi:coffee-maker"
 
-    def __init__(self, entry: ConfigEntry, executor) -> None:
+    def __init__(self, entry: ConfigEntry, executor, device_info: dict) -> None:
         self._entry = entry
         self._executor = executor
+        self._device_info = device_info
         self._attr_unique_id = f"{entry.entry_id}_recipe_status"
         # Register callback so executor can push updates
         executor.on_state_change = self._push_update
@@ -71,9 +72,4 @@ class CoffeeRecipeStatusSensor(SensorEntity):
 
     @property
     def device_info(self):
-        return {
-            "identifiers": {(DOMAIN, self._entry.entry_id)},
-            "name": "Coffee Recipe Manager",
-            "manufacturer": "VahaC",
-            "model": "Recipe Manager",
-        }
+        return self._device_info
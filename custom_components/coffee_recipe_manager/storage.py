@@ -1,9 +1,10 @@
 """Recipe storage - load and save recipes to YAML."""
 from __future__ import annotations
 
+from functools import lru_cache
 import logging
 import os
-from typing import Any
+from typing import Any, Collection
 
 import voluptuous as vol
 import yaml
@@ -33,6 +34,44 @@ RECIPE_SCHEMA = vol.Schema({
 })
 
 
+class _SlugTable(dict):
+    """str.translate table keeping [a-z0-9_] and mapping any other character to "_"."""
+
+    def __missing__(self, codepoint: int) -> str:
+        return "_"
+
+
+_SLUG_TABLE = _SlugTable({ord(c): c for c in "abcdefghijklmnopqrstuvwxyz0123456789_"})
+
+
+def slugify(name: str) -> str:
+    """Return the recipe key for *name* (same keys as re.sub("[^a-z0-9_]", "_", ...))."""
+    lowered = name.lower()
+    if lowered.isascii() and lowered.isalnum():
+        return lowered  # already a valid key (e.g. "espresso")
+    # Separator runs are kept as-is: collapsing them would change existing keys
+    return lowered.translate(_SLUG_TABLE).strip("_")
+
+
+@lru_cache(maxsize=256)
+def friendly_from_entity_id(entity_id: str) -> str:
+    """Return a display name derived from the entity id (e.g. "Milk Frothing")."""
+    return entity_id.split(".", 1)[-1].replace("_", " ").title()
+
+
+def _step_summary(step: dict) -> str:
+    """Return a short one-line summary of a step for the recipe list."""
+    parts = []
+    drink = step.get("drink")
+    if drink and drink.lower() != "none":
+        parts.append(f"{drink}{'×2' if step.get('double') else ''}")
+    for eid, cnt in (step.get("switch_counts") or {}).items():
+        cnt = int(cnt) if cnt else 0
+        if cnt > 0:
+            parts.append(f"{friendly_from_entity_id(eid)} ×{cnt}")
+    return ", ".join(parts) if parts else "(empty step)"
+
+
 class RecipeStorage:
     """Manages loading and saving recipes from/to YAML."""
 
@@ -40,18 +79,41 @@ class RecipeStorage:
         self.hass = hass
         self._filepath = filepath
         self._recipes: dict[str, dict] = {}
+        self._summaries: dict[str, str] = {}
+        self._keys: tuple[str, ...] = ()
+        self._name_to_key: dict[str, str] = {}
+        self._version = 0
         self.on_recipes_changed: callable | None = None
 
     @property
     def recipes(self) -> dict[str, dict]:
         return self._recipes
 
-    def get_recipe_names(self) -> list[str]:
-        return list(self._recipes.keys())
+    @property
+    def version(self) -> int:
+        """Counter bumped on every load/save/delete; use to invalidate derived caches."""
+        return self._version
+
+    @property
+    def summaries(self) -> dict[str, str]:
+        """Pre-formatted list_recipes line per recipe key."""
+        return self._summaries
+
+    def get_recipe_names(self) -> tuple[str, ...]:
+        return self._keys
 
     def get_recipe(self, name: str) -> dict | None:
         return self._recipes.get(name)
 
+    def find_recipe(self, name: str) -> dict | None:
+        """Look up a recipe by key, falling back to a case-insensitive name match."""
+        recipe = self._recipes.get(name)
+        if recipe is None:
+            key = self._name_to_key.get(name.lower())
+            if key is not None:
+                recipe = self._recipes.get(key)
+        return recipe
+
     async def load(self) -> None:
         """Load recipes from YAML file."""
         if not os.path.exists(self._filepath):
@@ -84,6 +146,9 @@ class RecipeStorage:
         """Add or update a recipe and save to file."""
         try:
             validated = RECIPE_SCHEMA(recipe)
+            if self._recipes.get(key) == validated:
+                # Unchanged edit: skip the YAML rewrite and cache rebuilds
+                return True
             self._recipes[key] = validated
             await self._save_all()
             self._notify_changed()
@@ -108,8 +173,30 @@ class RecipeStorage:
             yaml.dump(data, f, allow_unicode=True, sort_keys=False)
         _LOGGER.debug("Saved recipes to %s", self._filepath)
 
+    def _recompute_summaries(self) -> None:
+        """Rebuild the cached list_recipes lines from the current recipes."""
+        self._summaries = {
+            key: (
+                f"**{recipe['name']}** (`{key}`)  \n"
+                + ", ".join(_step_summary(s) for s in recipe.get("steps", []))
+            )
+            for key, recipe in self._recipes.items()
+        }
+
+    def _rebuild_index(self) -> None:
+        """Rebuild the key tuple and lower-case name → key lookup."""
+        self._keys = tuple(self._recipes)
+        # Names that differ only in case map to the first such recipe
+        name_to_key: dict[str, str] = {}
+        for key, recipe in self._recipes.items():
+            name_to_key.setdefault(recipe["name"].lower(), key)
+        self._name_to_key = name_to_key
+
     def _notify_changed(self) -> None:
-        """Call on_recipes_changed callback if set."""
+        """Refresh cached views and call on_recipes_changed callback if set."""
+        self._version += 1
+        self._rebuild_index()
+        self._recompute_summaries()
         if self.on_recipes_changed is not None:
             try:
                 self.on_recipes_changed()
@@ -117,8 +204,11 @@ class RecipeStorage:
                 pass
 
     @staticmethod
-    def validate_drinks(recipe: dict, allowed_drinks: list[str]) -> list[str]:
-        """Return list of invalid drink names found in recipe steps."""
+    def validate_drinks(recipe: dict, allowed_drinks: Collection[str]) -> list[str]:
+        """Return list of invalid drink names found in recipe steps.
+
+        Pass a set/frozenset for *allowed_drinks* to make each check O(1).
+        """
         invalid = []
         for step in recipe.get("steps", []):
             drink = step.get("drink", "")
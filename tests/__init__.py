@@ -0,0 +1 @@
+"""Tests for the Coffee Recipe Manager integration."""
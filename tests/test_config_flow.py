@@ -0,0 +1,101 @@
+"""Tests for the Coffee Recipe Manager config and options flows."""
+from unittest.mock import Mock, patch
+
+from homeassistant import config_entries
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.coffee_recipe_manager.config_flow import (
+    CoffeeRecipeManagerOptionsFlow,
+)
+from custom_components.coffee_recipe_manager.const import (
+    CONF_AUXILIARY_SWITCHES,
+    CONF_DRINK_OPTIONS,
+    CONF_FAULT_SENSORS,
+    CONF_MACHINE_DRINK_SELECT,
+    CONF_MACHINE_START_SWITCH,
+    CONF_MACHINE_WORK_STATE,
+    DEFAULT_FAULT_SENSORS,
+    DOMAIN,
+)
+
+
+async def test_faults_step_uses_default_sensors_when_omitted(hass: HomeAssistant) -> None:
+    """Submitting the faults step without the field stores the default sensor list."""
+    hass.states.async_set("select.machine_drink", "Espresso", {"options": ["Espresso"]})
+    hass.states.async_set("switch.machine_start", "off")
+    hass.states.async_set("sensor.machine_work_state", "standby")
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        {
+            CONF_MACHINE_DRINK_SELECT: "select.machine_drink",
+            CONF_MACHINE_START_SWITCH: "switch.machine_start",
+            CONF_MACHINE_WORK_STATE: "sensor.machine_work_state",
+        },
+    )
+    assert result["step_id"] == "drinks"
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {CONF_DRINK_OPTIONS: ["Espresso"]}
+    )
+    assert result["step_id"] == "faults"
+
+    result = await hass.config_entries.flow.async_configure(result["flow_id"], {})
+
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "notify"
+    with patch(
+        "custom_components.coffee_recipe_manager.async_setup_entry", return_value=True
+    ):
+        result = await hass.config_entries.flow.async_configure(result["flow_id"], {})
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert result["data"][CONF_FAULT_SENSORS] == list(DEFAULT_FAULT_SENSORS)
+
+
+async def test_recipe_step_form_with_configured_drinks(hass: HomeAssistant) -> None:
+    """The step form builds when drinks are configured (all-dict drink options)."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_DRINK_OPTIONS: ["Espresso", "Americano"], CONF_AUXILIARY_SWITCHES: []},
+    )
+    entry.add_to_hass(hass)
+    flow = CoffeeRecipeManagerOptionsFlow(entry)
+    flow.hass = hass
+
+    result = await flow.async_step_recipe_add({"name": "Morning", "description": ""})
+
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "recipe_step"
+    drink_selector = next(
+        value for key, value in result["data_schema"].schema.items() if key == "drink"
+    )
+    assert drink_selector.config["options"] == [
+        {"value": "none", "label": "— None —"},
+        {"value": "Espresso", "label": "Espresso"},
+        {"value": "Americano", "label": "Americano"},
+    ]
+
+
+async def test_recipe_edit_keeps_stored_name_when_cleared(hass: HomeAssistant) -> None:
+    """Submitting the edit form without a name falls back to the stored name."""
+    entry = MockConfigEntry(domain=DOMAIN, data={})
+    entry.add_to_hass(hass)
+    storage = Mock()
+    storage.get_recipe.return_value = {"name": "Morning", "description": "", "steps": []}
+    hass.data[DOMAIN] = {entry.entry_id: {"storage": storage}}
+    flow = CoffeeRecipeManagerOptionsFlow(entry)
+    flow.hass = hass
+    flow._edit_key = "morning"
+
+    result = await flow.async_step_recipe_edit()
+
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "recipe_edit"
+    assert result["data_schema"]({"description": "Updated"}) == {
+        "name": "Morning",
+        "description": "Updated",
+    }
@@ -0,0 +1,21 @@
+"""Tests for Coffee Recipe Manager recipe storage helpers."""
+import pytest
+
+from custom_components.coffee_recipe_manager.storage import slugify
+
+
+@pytest.mark.parametrize(
+    ("name", "key"),
+    [
+        ("Espresso", "espresso"),
+        ("Macchiato + Americano", "macchiato___americano"),
+        # Separator runs are not collapsed, matching keys saved by older versions
+        ("Latte  Art", "latte__art"),
+        ("Flat-_White", "flat__white"),
+        (" Iced Latte! ", "iced_latte"),
+        ("Café Crème", "caf__cr_me"),
+    ],
+)
+def test_slugify_keeps_legacy_keys(name: str, key: str) -> None:
+    """slugify() returns the same keys as the original regex-based slug."""
+    assert slugify(name) == key